@@ -0,0 +1,218 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+try:
+    import resource # Tidak tersedia di Windows
+except ImportError:
+    resource = None
+
+from CrossValidation import stratified_holdout
+from DataLoader import DEFAULT_CHUNK_SIZE, DELIMITER, NUMERIC_MODES, DataReader
+from Evaluation import ConfusionMatrix
+from NaiveBayesModel import NaiveBayesModel
+
+
+WRITE_CHUNK_ROWS = 100000 # Jumlah baris yang ditulis ke file per langkah saat membuat data sintetis
+
+
+def generate_dataset(file_path, rows, cardinalities, n_classes=2, class_skew=0.0, signal=0.5, seed=0):
+    """Membuat file data sintetis berformat `;` (ID; atribut...; Hipotesis).
+
+    Proporsi kelas mengikuti bobot 1 / (k + 1) ** class_skew (0 = seimbang). Setiap nilai atribut
+    dengan peluang signal diambil dari nilai khas kelasnya dan selain itu diambil acak seragam,
+    sehingga data bisa dipelajari tetapi tidak sempurna.
+    """
+    rng = np.random.default_rng(seed)
+    weights = 1.0 / np.arange(1, n_classes + 1) ** class_skew
+    # Nilai khas setiap (atribut, kelas)
+    preferred = [rng.integers(cardinality, size=n_classes) for cardinality in cardinalities]
+    attributes = ["No"] + [f"A{a + 1}" for a in range(len(cardinalities))] + ["Hipotesis"]
+    with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(DELIMITER.join(attributes) + "\n")
+        for start in range(0, rows, WRITE_CHUNK_ROWS):
+            n = min(WRITE_CHUNK_ROWS, rows - start)
+            class_codes = rng.choice(n_classes, size=n, p=weights / weights.sum())
+            columns = [np.arange(start + 1, start + n + 1).astype(str)]
+            for cardinality, values in zip(cardinalities, preferred):
+                codes = np.where(rng.random(n) < signal, values[class_codes], rng.integers(cardinality, size=n))
+                columns.append(np.char.add('v', codes.astype(str)))
+            columns.append(np.char.add('K', class_codes.astype(str)))
+            f.write("\n".join(DELIMITER.join(row) for row in zip(*(column.tolist() for column in columns))) + "\n")
+    return attributes
+
+
+def peak_rss_mb():
+    """Puncak resident set size proses sejauh ini (MB), atau None jika tidak tersedia."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan kilobyte, macOS melaporkan byte
+    return peak / (1 << 20) if sys.platform == 'darwin' else peak / 1024
+
+
+class StageTimer:
+    """Mencatat waktu, jumlah baris, dan puncak RSS setiap tahap benchmark."""
+
+    def __init__(self):
+        self.stages = {}
+
+    def run(self, name, function, rows):
+        """Menjalankan function(); rows boleh berupa fungsi yang menerima hasil tahap (dihitung di luar waktu tahap)."""
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        rows = rows(result) if callable(rows) else rows
+        self.stages[name] = {
+            'detik': elapsed,
+            'baris': rows,
+            'baris_per_detik': rows / elapsed if elapsed > 0 else None,
+            'peak_rss_mb': peak_rss_mb(),
+        }
+        return result
+
+
+def benchmark_gui(file_path):
+    """Mengukur tahap pipeline GUI (baca, split_data, train, test, evaluate) tanpa menampilkan jendela."""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5.QtWidgets import QApplication
+    from MyNaiveBayes import NaiveBayesClassifierGUI
+
+    app = QApplication.instance() or QApplication([]) # Harus tetap hidup selama widget dipakai
+    window = NaiveBayesClassifierGUI()
+    timer = StageTimer()
+    timer.run('parse', lambda: window.read_data(file_path), lambda _: len(window.data))
+    timer.run('split_data', window.split_data, lambda _: len(window.data))
+    timer.run('train', window.train, lambda _: len(window.training_data))
+    timer.run('test', window.test, lambda _: len(window.testing_data))
+    timer.run('evaluate', window.evaluate, lambda _: len(window.testing_data))
+    window.report.flush()
+    return timer.stages
+
+
+def benchmark_engine(file_path, chunk_size, test_fraction=0.3, seed=0, numeric_mode=None):
+    """Mengukur tahap yang sama memakai jalur kolumnar tanpa GUI (DataReader, NaiveBayesModel, ConfusionMatrix)."""
+    timer = StageTimer()
+
+    def parse():
+        reader = DataReader(file_path, chunk_size=chunk_size, numeric_mode=numeric_mode)
+        chunks = list(reader.iter_chunks())
+        codes = np.concatenate([chunk.codes for chunk in chunks]).astype(np.int64)
+        class_codes = np.concatenate([chunk.class_codes for chunk in chunks]).astype(np.int64)
+        numbers = np.concatenate([chunk.numbers for chunk in chunks]) if reader.gaussian_index else None
+        return reader, codes, class_codes, numbers
+
+    reader, codes, class_codes, numbers = timer.run('parse', parse, lambda result: len(result[1]))
+    test_indices = timer.run('split_data', lambda: stratified_holdout(class_codes, test_fraction, np.random.default_rng(seed)),
+                             len(class_codes))
+    train_mask = np.ones(len(class_codes), dtype=bool)
+    train_mask[test_indices] = False
+
+    def train():
+        class_counts, value_counts = NaiveBayesModel.count_encoded(
+            codes[train_mask], class_codes[train_mask], len(reader.classes), [len(vocabulary) for vocabulary in reader.vocabularies])
+        numeric_moments = None
+        if numbers is not None:
+            numeric_moments = NaiveBayesModel.count_moments(numbers[train_mask], class_codes[train_mask], len(reader.classes))
+        model = NaiveBayesModel.from_arrays(reader.attribute_list, reader.classes, reader.vocabularies, class_counts, value_counts,
+                                            attribute_types=reader.attribute_types, bin_edges=reader.bin_edges,
+                                            numeric_moments=numeric_moments)
+        model._ensure_tables()
+        return model
+
+    model = timer.run('train', train, int(train_mask.sum()))
+    test_numbers = numbers[test_indices] if numbers is not None else None
+    predicted = timer.run('test', lambda: model.predict_encoded(codes[test_indices], test_numbers), len(test_indices))
+
+    def evaluate():
+        confusion = ConfusionMatrix(model.classes)
+        confusion.update(class_codes[test_indices], predicted)
+        return confusion.metrics()
+
+    timer.run('evaluate', evaluate, len(test_indices))
+    return timer.stages
+
+
+def parse_cardinalities(text, n_attributes):
+    cardinalities = [int(value) for value in text.split(',')]
+    if len(cardinalities) == 1:
+        cardinalities *= n_attributes
+    if len(cardinalities) != n_attributes or min(cardinalities) < 1:
+        raise ValueError(f"--cardinality harus berisi 1 atau {n_attributes} bilangan positif.")
+    return cardinalities
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark pipeline Naive Bayes (parse, split_data, train, test, evaluate).")
+    parser.add_argument('--data', help="File data yang sudah ada; jika tidak diberikan, data sintetis dibuat")
+    parser.add_argument('--rows', type=int, default=100000, help="Jumlah baris data sintetis")
+    parser.add_argument('--attributes', type=int, default=4, help="Jumlah atribut prediktor data sintetis")
+    parser.add_argument('--cardinality', default='5', help="Jumlah nilai unik per atribut (satu angka atau daftar dipisah koma)")
+    parser.add_argument('--classes', type=int, default=2, help="Jumlah kelas data sintetis")
+    parser.add_argument('--class-skew', type=float, default=0.0, help="Kemiringan proporsi kelas (0 = seimbang)")
+    parser.add_argument('--seed', type=int, default=0, help="Seed pembuatan data sintetis")
+    parser.add_argument('--suite', choices=['gui', 'engine', 'all'], default='all', help="Jalur yang diukur")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="Jumlah baris per chunk untuk jalur engine")
+    parser.add_argument('--numeric', choices=list(NUMERIC_MODES) + ['off'], default=NUMERIC_MODES[0],
+                        help="Perlakuan kolom angka yang terdeteksi pada jalur engine")
+    parser.add_argument('-o', '--output', help="File JSON hasil (default: stdout)")
+    args = parser.parse_args(argv)
+
+    file_path = None
+    try:
+        dataset = {}
+        if args.data:
+            file_path = args.data
+            dataset['file'] = file_path
+        else:
+            cardinalities = parse_cardinalities(args.cardinality, args.attributes)
+            file_path = os.path.join(tempfile.mkdtemp(prefix='nb_benchmark_'), 'data.txt')
+            start = time.perf_counter()
+            generate_dataset(file_path, args.rows, cardinalities, args.classes, args.class_skew, seed=args.seed)
+            dataset.update({
+                'sintetis': True, 'baris': args.rows, 'kardinalitas': cardinalities, 'kelas': args.classes,
+                'class_skew': args.class_skew, 'seed': args.seed, 'detik_pembuatan': time.perf_counter() - start,
+            })
+        dataset['ukuran_byte'] = os.path.getsize(file_path)
+
+        result = {
+            'waktu': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'dataset': dataset,
+        }
+        # Jalur engine dijalankan lebih dulu agar puncak RSS-nya tidak tertutup oleh jalur GUI
+        if args.suite in ('engine', 'all'):
+            result['engine'] = benchmark_engine(file_path, args.chunk_size,
+                                                numeric_mode=None if args.numeric == 'off' else args.numeric)
+        if args.suite in ('gui', 'all'):
+            result['gui'] = benchmark_gui(file_path)
+        result['peak_rss_mb'] = peak_rss_mb()
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        # File data sintetis hanya dipakai sekali
+        if not args.data and file_path and os.path.exists(file_path):
+            os.remove(file_path)
+            os.rmdir(os.path.dirname(file_path))
+
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,214 @@
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from DataLoader import BINNED, DEFAULT_BINS, DEFAULT_CHUNK_SIZE, HASHED, DataReader
+from Evaluation import ConfusionMatrix
+from NaiveBayesModel import NaiveBayesModel
+
+
+class EncodedDataset:
+    """Seluruh data yang sudah di-encode beserta hitungan kelas dan nilai dari semua data.
+
+    Hitungan seluruh data dihitung sekali; hitungan training setiap fold diperoleh dengan
+    mengurangkan hitungan data testing fold tersebut, tanpa menghitung ulang dari awal.
+    Momen atribut gaussian diperlakukan sama (lihat NaiveBayesModel.subtract_moments()).
+    """
+
+    def __init__(self, attribute_list, classes, vocabularies, codes, class_codes, attribute_types=None,
+                 bin_edges=None, numbers=None, hash_buckets=0):
+        self.attribute_list = attribute_list
+        self.classes = classes
+        self.vocabularies = vocabularies
+        self.codes = codes # Kode atribut prediktor, bentuk (n, A)
+        self.class_codes = class_codes # Kode kelas, bentuk (n,)
+        self.attribute_types = attribute_types
+        self.bin_edges = bin_edges
+        self.numbers = numbers # Nilai atribut gaussian, bentuk (n, G), atau None
+        self.hash_buckets = hash_buckets
+        self.vocabulary_sizes = [len(vocabulary) for vocabulary in vocabularies]
+        self.class_counts, self.value_counts = NaiveBayesModel.count_encoded(
+            codes, class_codes, len(classes), self.vocabulary_sizes)
+        self.numeric_moments = None
+        if numbers is not None:
+            self.numeric_moments = NaiveBayesModel.count_moments(numbers, class_codes, len(classes))
+
+    @classmethod
+    def from_file(cls, file_path, chunk_size=DEFAULT_CHUNK_SIZE, on_warning=None, numeric_mode=None, n_bins=DEFAULT_BINS,
+                  hash_buckets=0):
+        """Membaca file data berformat `;` per chunk dan menggabungkan array kodenya."""
+        reader = DataReader(file_path, chunk_size=chunk_size, on_warning=on_warning, numeric_mode=numeric_mode, n_bins=n_bins,
+                            hash_buckets=hash_buckets)
+        code_chunks, class_code_chunks, number_chunks = [], [], []
+        for chunk in reader.iter_chunks():
+            code_chunks.append(chunk.codes)
+            class_code_chunks.append(chunk.class_codes)
+            number_chunks.append(chunk.numbers)
+        if not code_chunks:
+            raise ValueError("Tidak ada data valid ditemukan setelah header.")
+        numbers = np.concatenate(number_chunks) if reader.gaussian_index else None
+        return cls(reader.attribute_list, reader.classes, reader.vocabularies,
+                   np.concatenate(code_chunks).astype(np.int64), np.concatenate(class_code_chunks).astype(np.int64),
+                   reader.attribute_types, reader.bin_edges, numbers, hash_buckets)
+
+
+def stratified_kfold(class_codes, n_folds, rng):
+    """Membagi indeks data menjadi n_folds fold dengan proporsi kelas yang sama (acak per kelas)."""
+    fold_of = np.empty(len(class_codes), dtype=np.int64)
+    for c in np.unique(class_codes):
+        indices = np.flatnonzero(class_codes == c)
+        rng.shuffle(indices)
+        # Titik awal acak agar kelas kecil tidak selalu masuk fold pertama
+        fold_of[indices] = (np.arange(len(indices)) + rng.integers(n_folds)) % n_folds
+    return [np.flatnonzero(fold_of == fold) for fold in range(n_folds)]
+
+
+def stratified_holdout(class_codes, test_fraction, rng):
+    """Memilih indeks data testing secara acak per kelas, seperti split_data() pada GUI."""
+    test_indices = []
+    for c in np.unique(class_codes):
+        indices = np.flatnonzero(class_codes == c)
+        rng.shuffle(indices)
+        split_index = round(len(indices) * (1 - test_fraction))
+        test_indices.append(indices[split_index:])
+    return np.sort(np.concatenate(test_indices))
+
+
+def evaluate_fold(dataset, test_indices):
+    """Melatih model dari hitungan seluruh data dikurangi hitungan fold, lalu menguji fold tersebut.
+
+    Mengembalikan confusion matrix (C, C) (baris: aktual, kolom: prediksi).
+    """
+    n_classes = len(dataset.classes)
+    test_codes = dataset.codes[test_indices]
+    test_class_codes = dataset.class_codes[test_indices]
+    fold_class_counts, fold_value_counts = NaiveBayesModel.count_encoded(
+        test_codes, test_class_codes, n_classes, dataset.vocabulary_sizes)
+    class_counts = dataset.class_counts - fold_class_counts
+    value_counts = [full - fold for full, fold in zip(dataset.value_counts, fold_value_counts)]
+
+    numeric_moments = test_numbers = None
+    if dataset.numbers is not None:
+        test_numbers = dataset.numbers[test_indices]
+        fold_moments = NaiveBayesModel.count_moments(test_numbers, test_class_codes, n_classes)
+        numeric_moments = NaiveBayesModel.subtract_moments(*dataset.numeric_moments, *fold_moments)
+
+    # Model fold hanya memuat kelas dan nilai yang muncul di data training fold, sehingga
+    # |V_X| dan fallback nilai yang tidak terlihat sama dengan training dari awal.
+    # Interval atribut binned dan bucket atribut hashed sudah tetap, jadi vocabulary-nya tidak dikurangi
+    train_classes = np.flatnonzero(class_counts > 0)
+    attribute_types = dataset.attribute_types or [None] * len(dataset.vocabularies)
+    vocabularies, train_value_counts, code_maps = [], [], []
+    for vocabulary, counts, attribute_type in zip(dataset.vocabularies, value_counts, attribute_types):
+        if attribute_type in (BINNED, HASHED):
+            present = np.arange(len(vocabulary))
+        else:
+            present = np.flatnonzero(counts.sum(axis=0) > 0)
+        code_map = np.full(len(vocabulary) + 1, len(present), dtype=np.int64) # Kode lain -> fallback
+        code_map[present] = np.arange(len(present))
+        code_maps.append(code_map)
+        vocabularies.append([vocabulary[v] for v in present])
+        train_value_counts.append(counts[np.ix_(train_classes, present)])
+    if numeric_moments is not None:
+        numeric_moments = tuple(moment[train_classes] for moment in numeric_moments)
+    model = NaiveBayesModel.from_arrays(dataset.attribute_list, [dataset.classes[c] for c in train_classes],
+                                        vocabularies, class_counts[train_classes], train_value_counts,
+                                        attribute_types=dataset.attribute_types, bin_edges=dataset.bin_edges,
+                                        numeric_moments=numeric_moments, hash_buckets=dataset.hash_buckets)
+
+    fold_codes = np.empty_like(test_codes)
+    for a, code_map in enumerate(code_maps):
+        fold_codes[:, a] = code_map[test_codes[:, a]]
+    predicted = train_classes[model.predict_encoded(fold_codes, test_numbers)]
+    return np.bincount(test_class_codes * n_classes + predicted, minlength=n_classes * n_classes).reshape(n_classes, n_classes)
+
+
+_worker_dataset = None # EncodedDataset milik proses worker, diisi oleh _init_worker()
+
+
+def _init_worker(dataset):
+    global _worker_dataset
+    _worker_dataset = dataset
+
+
+def _evaluate_fold_worker(test_indices):
+    return evaluate_fold(_worker_dataset, test_indices)
+
+
+def _nan_to_none(values):
+    """Mengubah NaN (metrik kelas tanpa data testing) menjadi None agar hasil tetap JSON yang valid."""
+    return [None if np.isnan(value) else value for value in values]
+
+
+def cross_validate(dataset, n_folds=5, repeats=1, test_fraction=None, seed=0, n_workers=1):
+    """Menjalankan stratified k-fold berulang (atau repeated holdout jika test_fraction diberikan).
+
+    Mengembalikan dict berisi metrik setiap fold, rata-rata dan simpangan bakunya, serta
+    confusion matrix gabungan semua fold. Presisi, recall, dan F1 kelas yang tidak memiliki
+    data testing di suatu fold bernilai None dan tidak ikut dirata-rata.
+    """
+    if repeats < 1:
+        raise ValueError(f"Jumlah ulangan harus minimal 1 (diberikan {repeats}).")
+    if test_fraction is not None:
+        if not 0 < test_fraction < 1:
+            raise ValueError(f"Proporsi data testing harus di antara 0 dan 1 (diberikan {test_fraction}).")
+    else:
+        class_sizes = np.bincount(dataset.class_codes)
+        smallest = int(class_sizes[class_sizes > 0].min()) if len(dataset.class_codes) else 0
+        if not 2 <= n_folds <= smallest:
+            raise ValueError(f"Jumlah fold harus di antara 2 dan jumlah data kelas terkecil ({smallest}); diberikan {n_folds}.")
+    rng = np.random.default_rng(seed)
+    splits = [] # (ulangan, fold, indeks testing)
+    for repeat in range(repeats):
+        if test_fraction is not None:
+            splits.append((repeat, 0, stratified_holdout(dataset.class_codes, test_fraction, rng)))
+        else:
+            for fold, test_indices in enumerate(stratified_kfold(dataset.class_codes, n_folds, rng)):
+                splits.append((repeat, fold, test_indices))
+
+    test_sets = [test_indices for _, _, test_indices in splits]
+    n_workers = n_workers or os.cpu_count() or 1
+    if n_workers > 1 and len(splits) > 1:
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=(dataset,)) as executor:
+            confusion_matrices = list(executor.map(_evaluate_fold_worker, test_sets))
+    else:
+        confusion_matrices = [evaluate_fold(dataset, test_indices) for test_indices in test_sets]
+
+    metric_names = ('precision', 'recall', 'f1')
+    folds = []
+    for (repeat, fold, test_indices), confusion_matrix in zip(splits, confusion_matrices):
+        metrics = ConfusionMatrix(dataset.classes, confusion_matrix).metrics()
+        present = metrics['support'] > 0 # Kelas yang memiliki data testing di fold ini
+        per_class = {name: np.where(present, metrics[name], np.nan) for name in metric_names}
+        folds.append({
+            'repeat': repeat,
+            'fold': fold,
+            'n_test': len(test_indices),
+            'accuracy': metrics['accuracy'],
+            **{name: dict(zip(dataset.classes, _nan_to_none(values.tolist()))) for name, values in per_class.items()},
+            'macro_f1': float(per_class['f1'][present].mean()) if present.any() else None,
+        })
+
+    # Rata-rata dan simpangan baku setiap metrik dihitung per kelas atas fold yang memiliki data kelas tersebut
+    summaries = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning) # Kelas tanpa data testing di semua fold menghasilkan NaN
+        for statistic in ('mean', 'std'):
+            function = getattr(np, 'nan' + statistic)
+            summary = {}
+            for name in ('accuracy', 'macro_f1'):
+                summary[name] = _nan_to_none([float(function(np.array([fold[name] for fold in folds], dtype=np.float64)))])[0]
+            for name in metric_names:
+                values = np.array([list(fold[name].values()) for fold in folds], dtype=np.float64)
+                summary[name] = dict(zip(dataset.classes, _nan_to_none(function(values, axis=0).tolist())))
+            summaries[statistic] = summary
+    total_confusion = ConfusionMatrix(dataset.classes, np.sum(confusion_matrices, axis=0))
+    return {
+        'classes': list(dataset.classes),
+        'folds': folds,
+        'mean': summaries['mean'],
+        'std': summaries['std'],
+        'confusion_matrix': total_confusion.to_dict()['confusion_matrix'],
+    }
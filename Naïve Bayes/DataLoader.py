@@ -0,0 +1,375 @@
+import zlib
+from collections import namedtuple
+from collections.abc import Sequence
+
+import numpy as np
+
+
+DEFAULT_CHUNK_SIZE = 65536 # Jumlah baris per chunk
+DELIMITER = ';'
+
+# Tipe atribut prediktor
+CATEGORICAL = 'categorical' # Nilai kategorikal, dictionary encoding
+GAUSSIAN = 'gaussian' # Numerik kontinu, likelihood distribusi normal per kelas
+BINNED = 'binned' # Numerik yang dikelompokkan ke interval kuantil, lalu diperlakukan kategorikal
+HASHED = 'hashed' # Kategorikal berkardinalitas tinggi, nilai di-hash ke sejumlah bucket tetap
+NUMERIC_MODES = (GAUSSIAN, BINNED)
+DEFAULT_BINS = 10 # Jumlah interval kuantil untuk mode binned
+MIN_NUMERIC_UNIQUE = 20 # Kolom angka dengan nilai unik sebanyak ini atau kurang tetap dianggap kategorikal
+
+# Satu potongan data kolumnar: ID data (list str), kode atribut prediktor (n, A),
+# kode kelas (n,), nomor baris di file (n,) dan nilai atribut gaussian (n, G) atau None
+DataChunk = namedtuple('DataChunk', ['ids', 'codes', 'class_codes', 'line_numbers', 'numbers'], defaults=(None,))
+
+
+def encode_values(values, index, vocabulary=None, dtype=np.int64):
+    """Mengubah nilai kategorikal menjadi kode integer.
+
+    Jika vocabulary diberikan, nilai baru ditambahkan ke vocabulary dan index; jika tidak,
+    nilai yang tidak dikenal diberi kode len(index).
+    """
+    if vocabulary is not None:
+        def code_of(value):
+            code = index.get(value)
+            if code is None:
+                code = index[value] = len(vocabulary)
+                vocabulary.append(value)
+            return code
+        return np.fromiter(map(code_of, values), dtype=dtype, count=len(values))
+    unseen = len(index)
+    return np.fromiter((index.get(value, unseen) for value in values), dtype=dtype, count=len(values))
+
+
+def parse_numbers(values):
+    """Mengubah nilai teks menjadi array float64; koma dianggap pemisah desimal dan nilai
+    yang bukan angka menjadi NaN (dianggap tidak ada)."""
+    values = [value.replace(',', '.') for value in values]
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except ValueError:
+        def to_float(value):
+            try:
+                return float(value)
+            except ValueError:
+                return np.nan
+        return np.fromiter(map(to_float, values), dtype=np.float64, count=len(values))
+
+
+def detect_attribute_types(columns, numeric_mode, hash_buckets=0):
+    """Menentukan tipe setiap kolom atribut: HASHED jika hash_buckets > 0 dan jumlah nilai uniknya
+    melebihi hash_buckets, numeric_mode (GAUSSIAN atau BINNED) jika semua nilainya angka dan jumlah
+    nilai uniknya lebih dari MIN_NUMERIC_UNIQUE, selain itu CATEGORICAL.
+
+    Hashing diperiksa lebih dulu agar kode berkardinalitas tinggi yang berupa angka (kode wilayah,
+    ID merchant) tidak dimodelkan sebagai distribusi normal; akibatnya kolom angka sungguhan dengan
+    nilai unik lebih dari hash_buckets juga di-hash.
+    """
+    types = []
+    for column in columns:
+        attribute_type = CATEGORICAL
+        n_unique = len(set(column))
+        if hash_buckets and n_unique > hash_buckets:
+            attribute_type = HASHED
+        elif numeric_mode and n_unique > MIN_NUMERIC_UNIQUE and np.isfinite(parse_numbers(column)).all():
+            attribute_type = numeric_mode
+        types.append(attribute_type)
+    return types
+
+
+def quantile_edges(numbers, n_bins=DEFAULT_BINS):
+    """Batas dalam interval kuantil (paling banyak n_bins - 1 batas unik) dari nilai numerik."""
+    numbers = numbers[np.isfinite(numbers)]
+    if not len(numbers):
+        return np.zeros(0)
+    return np.unique(np.quantile(numbers, np.linspace(0, 1, n_bins + 1)[1:-1]))
+
+
+def bin_labels(edges):
+    """Label interval untuk setiap kode bin (vocabulary atribut binned).
+
+    Presisi angka ditambah sampai semua batas memiliki teks yang berbeda, sehingga setiap bin
+    memiliki label unik.
+    """
+    if not len(edges):
+        return ["semua nilai"]
+    for precision in range(6, 18):
+        labels = [f"{edge:.{precision}g}" for edge in edges]
+        if len(set(labels)) == len(labels):
+            break
+    edges = labels
+    return [f"< {edges[0]}"] + [f"{low} - {high}" for low, high in zip(edges, edges[1:])] + [f">= {edges[-1]}"]
+
+
+class HashedVocabulary(Sequence):
+    """Vocabulary atribut hashed: n_buckets label '#b' yang tidak disimpan satu per satu,
+    sehingga ukurannya tetap berapa pun jumlah nilai aslinya."""
+
+    def __init__(self, n_buckets):
+        self.n_buckets = n_buckets
+
+    def __len__(self):
+        return self.n_buckets
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.n_buckets))]
+        if index < 0:
+            index += self.n_buckets
+        if not 0 <= index < self.n_buckets:
+            raise IndexError(index)
+        return f"#{index}"
+
+    def __eq__(self, other):
+        return isinstance(other, HashedVocabulary) and other.n_buckets == self.n_buckets
+
+
+def hash_values(values, n_buckets, dtype=np.int64):
+    """Kode bucket setiap nilai: CRC32 (stabil antar proses, tidak seperti hash()) modulo n_buckets."""
+    return np.fromiter((zlib.crc32(value.encode('utf-8')) % n_buckets for value in values), dtype=dtype, count=len(values))
+
+
+def attribute_vocabulary(attribute_type, bin_edges=None, hash_buckets=0):
+    """Vocabulary awal atribut: label interval (binned), bucket (hashed), atau kosong."""
+    if attribute_type == BINNED and bin_edges is not None:
+        return bin_labels(bin_edges)
+    if attribute_type == HASHED:
+        return HashedVocabulary(hash_buckets)
+    return []
+
+
+def vocabulary_index(vocabulary):
+    """Nilai -> kode untuk vocabulary; atribut hashed tidak memerlukan index."""
+    if isinstance(vocabulary, HashedVocabulary):
+        return {}
+    return {value: v for v, value in enumerate(vocabulary)}
+
+
+def encode_column(values, attribute_type, index, vocabulary=None, bin_edges=None, dtype=np.int64, n_buckets=0):
+    """Mengubah satu kolom atribut menjadi kode sesuai tipenya.
+
+    Atribut binned diberi kode interval (nilai yang bukan angka mendapat kode fallback),
+    atribut hashed diberi kode bucket (tidak pernah fallback), dan atribut gaussian selalu
+    diberi kode 0, yaitu satu baris netral di tabel log-likelihood; nilai gaussian dibaca
+    terpisah dengan parse_numbers().
+    """
+    if attribute_type == GAUSSIAN:
+        return np.zeros(len(values), dtype=dtype)
+    if attribute_type == HASHED:
+        return hash_values(values, n_buckets, dtype)
+    if attribute_type == BINNED:
+        numbers = parse_numbers(values)
+        codes = np.searchsorted(bin_edges, numbers, side='right')
+        codes[np.isnan(numbers)] = len(bin_edges) + 1
+        return codes.astype(dtype)
+    return encode_values(values, index, vocabulary, dtype)
+
+
+def count_newlines(f, start, end, block_size=1 << 24):
+    """Menghitung jumlah baris baru pada rentang byte [start, end) dari file biner."""
+    f.seek(start)
+    count = 0
+    remaining = end - start
+    while remaining > 0:
+        block = f.read(min(block_size, remaining))
+        if not block:
+            break
+        count += block.count(b'\n')
+        remaining -= len(block)
+    return count
+
+
+def split_line(line):
+    """Memecah satu baris file data menjadi nilai-nilai yang sudah di-strip."""
+    return [value.strip() for value in line.strip().split(DELIMITER)]
+
+
+class DataReader:
+    """Pembaca streaming untuk file data berformat `;` (header + baris data).
+
+    File dibaca baris demi baris dan dikumpulkan menjadi chunk berukuran tetap berisi
+    array kode kategori per kolom, sehingga memori puncak tidak bergantung pada ukuran
+    file (hanya pada chunk_size dan jumlah nilai unik). Kolom pertama adalah ID data dan
+    kolom terakhir adalah hipotesis (kelas).
+
+    Tanpa model, nilai baru ditambahkan ke vocabulary milik reader. Dengan model, reader
+    memakai vocabulary model; nilai yang tidak dikenal diberi kode |V_X|, atau ditambahkan
+    ke vocabulary model jika grow=True (untuk partial_fit_encoded()).
+
+    byte_range (start, end) membatasi pembacaan pada baris-baris yang dimulai di rentang
+    tersebut (lihat ParallelTraining.byte_ranges()); nomor baris pada chunk dan iter_rows() lalu
+    dihitung relatif terhadap awal rentang (baris pertama rentang = 1), sedangkan pesan peringatan
+    tetap memakai nomor baris di file. Dengan labeled=False file tidak memiliki
+    kolom hipotesis (data yang akan diprediksi) dan class_codes pada chunk bernilai None.
+
+    Tipe atribut diambil dari model, dari attribute_types, atau dideteksi dari chunk_size baris
+    pertama jika numeric_mode (GAUSSIAN atau BINNED) atau hash_buckets diberikan. Batas interval
+    atribut binned yang belum diketahui juga dihitung dari baris-baris tersebut.
+    """
+
+    def __init__(self, file_path, chunk_size=DEFAULT_CHUNK_SIZE, on_warning=None, model=None, grow=False,
+                 byte_range=None, labeled=True, numeric_mode=None, n_bins=DEFAULT_BINS, attribute_types=None,
+                 bin_edges=None, hash_buckets=0):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.byte_range = byte_range
+        self.on_warning = on_warning # Callback untuk pesan peringatan per baris
+        self.skipped_rows = 0 # Jumlah baris yang dilewati
+        self._line_offset = None # Nomor baris file sebelum awal byte_range, dihitung saat peringatan pertama
+        self.attributes = self._read_header()
+        self.labeled = labeled
+        if labeled:
+            self.attribute_list = self.attributes[1:-1] # Atribut prediktor (selain ID dan kelas)
+            self.class_attribute = self.attributes[-1] # Atribut kelas
+        else:
+            self.attribute_list = self.attributes[1:]
+            self.class_attribute = None
+
+        if model is not None:
+            if model.attribute_list != self.attribute_list:
+                raise ValueError(f"Atribut file {self.attribute_list} tidak sesuai dengan atribut model {model.attribute_list}.")
+            self.grow = grow
+            self.attribute_types, self.bin_edges = model.attribute_types, model.bin_edges
+            self.hash_buckets = model.hash_buckets
+            self.vocabularies, self.value_index = model.vocabularies, model.value_index
+            self.classes, self.class_index = model.classes, model.class_index
+        else:
+            self.grow = True
+            self.hash_buckets = hash_buckets
+            self._resolve_types(numeric_mode, n_bins, attribute_types, bin_edges)
+            # Nilai unik per atribut, indeks = kode; atribut binned dan hashed sudah berisi label interval/bucket
+            self.vocabularies = [attribute_vocabulary(attribute_type, edges, hash_buckets)
+                                 for attribute_type, edges in zip(self.attribute_types, self.bin_edges)]
+            self.value_index = [vocabulary_index(vocabulary) for vocabulary in self.vocabularies] # Nilai -> kode, per atribut
+            self.classes = [] # Label kelas, indeks = kode kelas
+            self.class_index = {} # Label kelas -> kode kelas
+        self.gaussian_index = [a for a, attribute_type in enumerate(self.attribute_types) if attribute_type == GAUSSIAN]
+
+    def _read_header(self):
+        with open(self.file_path, 'r', encoding='utf-8') as f: # Gunakan encoding utf-8
+            header = f.readline()
+        if not header:
+            raise ValueError("File kosong.")
+        attributes = split_line(header)
+        if not attributes:
+            raise ValueError("Header tidak ditemukan atau format salah.")
+        if len(attributes) < 2:
+            raise ValueError("File harus memiliki setidaknya atribut ID dan Hipotesis.")
+        return attributes
+
+    def _resolve_types(self, numeric_mode, n_bins, attribute_types, bin_edges):
+        """Menentukan tipe dan batas interval setiap atribut (tanpa model)."""
+        n_attributes = len(self.attribute_list)
+        self.bin_edges = [None if edges is None else np.asarray(edges, dtype=np.float64)
+                          for edges in (bin_edges or [None] * n_attributes)]
+        columns = None
+        if attribute_types is not None:
+            self.attribute_types = list(attribute_types)
+        elif numeric_mode or self.hash_buckets:
+            columns = self._sample_columns()
+            self.attribute_types = detect_attribute_types(columns, numeric_mode, self.hash_buckets)
+        else:
+            self.attribute_types = [CATEGORICAL] * n_attributes
+        for a, attribute_type in enumerate(self.attribute_types):
+            if attribute_type == BINNED and self.bin_edges[a] is None:
+                columns = columns if columns is not None else self._sample_columns()
+                self.bin_edges[a] = quantile_edges(parse_numbers(columns[a]), n_bins)
+
+    def _sample_columns(self):
+        """Kolom atribut prediktor dari paling banyak chunk_size baris valid pertama (tanpa peringatan)."""
+        rows = []
+        with open(self.file_path, 'r', encoding='utf-8') as f:
+            f.readline() # Lewati header
+            for line in f:
+                values = split_line(line)
+                if len(values) == len(self.attributes) and values[0]:
+                    rows.append(values[1:1 + len(self.attribute_list)])
+                    if len(rows) >= self.chunk_size:
+                        break
+        columns = [list(column) for column in zip(*rows)]
+        return columns if columns else [[] for _ in self.attribute_list]
+
+    def _warn(self, message):
+        self.skipped_rows += 1
+        if self.on_warning is not None:
+            self.on_warning(message)
+
+    def _file_line_number(self, line_number):
+        """Mengubah nomor baris dari _iter_lines() menjadi nomor baris di file.
+
+        Untuk byte_range, baris baru sebelum awal rentang hanya dihitung sekali dan hanya jika
+        ada peringatan, sehingga shard terakhir tidak perlu memindai hampir seluruh file.
+        """
+        if self.byte_range is None:
+            return line_number
+        if self._line_offset is None:
+            with open(self.file_path, 'rb') as f:
+                f.readline() # Lewati header
+                self._line_offset = 1 + count_newlines(f, f.tell(), self.byte_range[0])
+        return self._line_offset + line_number
+
+    def _iter_lines(self):
+        """Menghasilkan (nomor baris, teks baris) untuk setiap baris setelah header.
+
+        Dengan byte_range nomor baris relatif terhadap awal rentang (lihat _file_line_number()).
+        """
+        if self.byte_range is None:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                f.readline() # Lewati header
+                yield from enumerate(f, start=2)
+            return
+
+        start, end = self.byte_range
+        with open(self.file_path, 'rb') as f:
+            f.seek(start)
+            line_number = 1
+            position = start
+            while position < end:
+                line = f.readline()
+                if not line:
+                    break
+                position += len(line)
+                yield line_number, line.decode('utf-8')
+                line_number += 1
+
+    def iter_rows(self):
+        """Menghasilkan (nomor baris, nilai-nilai) untuk setiap baris data yang valid."""
+        for line_number, line in self._iter_lines():
+            values = split_line(line)
+            if len(values) != len(self.attributes):
+                self._warn(f"Peringatan: Baris {self._file_line_number(line_number)} dilewati karena jumlah kolom tidak sesuai ({len(values)} vs {len(self.attributes)}).")
+                continue
+            # Pastikan ID data ada
+            if not values[0]:
+                self._warn(f"Peringatan: Baris {self._file_line_number(line_number)} dilewati karena ID data kosong.")
+                continue
+            yield line_number, values
+
+    def _make_chunk(self, line_numbers, rows):
+        columns = list(zip(*rows))
+        codes = np.empty((len(rows), len(self.attribute_list)), dtype=np.int32)
+        for a, attribute_type in enumerate(self.attribute_types):
+            codes[:, a] = encode_column(columns[a + 1], attribute_type, self.value_index[a],
+                                        self.vocabularies[a] if self.grow else None, self.bin_edges[a], dtype=np.int32,
+                                        n_buckets=self.hash_buckets)
+        class_codes = None
+        if self.labeled:
+            class_codes = encode_values(columns[-1], self.class_index, self.classes if self.grow else None, dtype=np.int32)
+        numbers = None
+        if self.gaussian_index:
+            numbers = np.column_stack([parse_numbers(columns[a + 1]) for a in self.gaussian_index])
+        return DataChunk(list(columns[0]), codes, class_codes, np.array(line_numbers, dtype=np.int64), numbers)
+
+    def iter_chunks(self):
+        """Menghasilkan DataChunk berukuran paling banyak chunk_size baris."""
+        line_numbers, rows = [], []
+        for line_number, values in self.iter_rows():
+            line_numbers.append(line_number)
+            rows.append(values)
+            if len(rows) >= self.chunk_size:
+                yield self._make_chunk(line_numbers, rows)
+                line_numbers, rows = [], []
+        if rows:
+            yield self._make_chunk(line_numbers, rows)
+
+    def __iter__(self):
+        return self.iter_chunks()
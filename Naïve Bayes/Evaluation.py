@@ -0,0 +1,107 @@
+import numpy as np
+
+from DataLoader import encode_values
+
+
+class ConfusionMatrix:
+    """Confusion matrix C x C berbasis array integer (baris: aktual, kolom: prediksi).
+
+    Matrix diperbarui bertahap per batch prediksi dengan satu np.bincount, dan seluruh
+    metrik per kelas dihitung sekaligus secara vektor dari diagonal serta jumlah baris
+    dan kolom, sehingga evaluasi jutaan baris data testing sebanding dengan satu kali scan.
+    """
+
+    def __init__(self, classes, matrix=None):
+        self.classes = list(classes) # Label kelas, indeks = kode kelas
+        self.class_index = {class_label: c for c, class_label in enumerate(self.classes)}
+        n_classes = len(self.classes)
+        self.matrix = np.zeros((n_classes, n_classes), dtype=np.int64) if matrix is None else np.asarray(matrix, dtype=np.int64)
+
+    def encode_labels(self, labels):
+        """Mengubah label kelas menjadi array kode; kelas baru ditambahkan sebagai baris dan kolom baru."""
+        n_before = len(self.classes)
+        codes = encode_values(list(labels), self.class_index, self.classes)
+        grown = len(self.classes) - n_before
+        if grown:
+            self.matrix = np.pad(self.matrix, ((0, grown), (0, grown)))
+        return codes
+
+    def add_class(self, class_label):
+        """Mengembalikan kode kelas, menambahkan kelas ke matrix jika belum ada."""
+        return int(self.encode_labels([class_label])[0])
+
+    def update(self, actual_codes, predicted_codes):
+        """Menambahkan pasangan (aktual, prediksi) berupa array kode kelas."""
+        n_classes = len(self.classes)
+        actual_codes = np.asarray(actual_codes, dtype=np.int64)
+        predicted_codes = np.asarray(predicted_codes, dtype=np.int64)
+        self.matrix += np.bincount(actual_codes * n_classes + predicted_codes,
+                                   minlength=n_classes * n_classes).reshape(n_classes, n_classes)
+
+    def update_labels(self, actual_labels, predicted_labels):
+        """Seperti update() untuk label kelas; kelas baru ditambahkan ke matrix."""
+        actual_codes = self.encode_labels(actual_labels)
+        predicted_codes = self.encode_labels(predicted_labels)
+        self.update(actual_codes, predicted_codes)
+
+    def merge(self, other):
+        """Menjumlahkan confusion matrix lain (misalnya dari shard atau fold lain) ke matrix ini."""
+        codes = self.encode_labels(other.classes)
+        self.matrix[np.ix_(codes, codes)] += other.matrix
+        return self
+
+    @property
+    def total(self):
+        return int(self.matrix.sum())
+
+    @property
+    def correct(self):
+        return int(np.trace(self.matrix))
+
+    def metrics(self):
+        """Menghitung akurasi serta TP, FP, FN, presisi, recall, dan F1 per kelas dalam satu
+        langkah vektor, beserta rata-rata macro dan micro."""
+        TP = np.diag(self.matrix)
+        predicted_totals = self.matrix.sum(axis=0) # TP + FP
+        actual_totals = self.matrix.sum(axis=1) # TP + FN
+        FP = predicted_totals - TP
+        FN = actual_totals - TP
+
+        def ratio(numerator, denominator):
+            numerator = np.asarray(numerator, dtype=np.float64)
+            return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=np.asarray(denominator) > 0)
+
+        precision = ratio(TP, predicted_totals)
+        recall = ratio(TP, actual_totals)
+        f1 = ratio(2 * precision * recall, precision + recall)
+        total = self.total
+        # Untuk klasifikasi satu label, presisi, recall, dan F1 micro sama dengan akurasi
+        micro = float(TP.sum() / total) if total > 0 else 0.0
+        return {
+            'accuracy': micro,
+            'TP': TP, 'FP': FP, 'FN': FN,
+            'support': actual_totals,
+            'precision': precision,
+            'recall': recall,
+            'f1': f1,
+            'macro': {'precision': float(precision.mean()) if len(TP) else 0.0,
+                      'recall': float(recall.mean()) if len(TP) else 0.0,
+                      'f1': float(f1.mean()) if len(TP) else 0.0},
+            'micro': {'precision': micro, 'recall': micro, 'f1': micro},
+        }
+
+    def to_dict(self):
+        """Confusion matrix dan metrik dalam bentuk yang bisa ditulis sebagai JSON."""
+        metrics = self.metrics()
+        return {
+            'jumlah_data': self.total,
+            'akurasi': metrics['accuracy'],
+            'confusion_matrix': {actual: dict(zip(self.classes, row)) for actual, row in zip(self.classes, self.matrix.tolist())},
+            'per_kelas': {
+                class_label: {'presisi': p, 'recall': r, 'f1': f, 'support': s}
+                for class_label, p, r, f, s in zip(self.classes, metrics['precision'].tolist(), metrics['recall'].tolist(),
+                                                   metrics['f1'].tolist(), metrics['support'].tolist())
+            },
+            'macro': metrics['macro'],
+            'micro': metrics['micro'],
+        }
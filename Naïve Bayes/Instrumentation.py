@@ -0,0 +1,163 @@
+import cProfile
+import io
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+
+PROFILE_TOP_FUNCTIONS = 25 # Jumlah fungsi teratas (cumulative time) di hasil cProfile
+MEMORY_TOP_SITES = 10 # Jumlah lokasi alokasi teratas di hasil tracemalloc
+
+_DISABLED_STAGE = nullcontext() # Dipakai ulang agar stage() tanpa instrumentasi hampir tanpa biaya
+
+
+class Instrumentation:
+    """Timer per tahap, counter, serta profil cProfile/tracemalloc opsional untuk satu kali proses.
+
+    Jika enabled=False, stage() mengembalikan context manager kosong dan count() langsung
+    kembali, sehingga pemanggil cukup memeriksa `enabled` sebelum menghitung counter yang
+    mahal (misalnya jumlah nilai fallback di satu batch).
+    """
+
+    def __init__(self, enabled=False, profile=False, trace_memory=False):
+        self.enabled = enabled or profile or trace_memory
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self._lock = threading.Lock() # Tahap 'render' dicatat dari thread GUI, tahap lain dari thread worker
+        self.reset()
+
+    def reset(self):
+        self.timers = defaultdict(lambda: [0.0, 0]) # Nama tahap -> [total detik, jumlah panggilan]
+        self.counters = defaultdict(int)
+        self.profiler = None
+        self.profile_stats = None # pstats.Stats setelah stop()
+        self.memory = None # Hasil tracemalloc setelah stop()
+
+    def start(self):
+        """Mengosongkan hasil sebelumnya dan memulai cProfile/tracemalloc jika diminta.
+
+        cProfile hanya memprofil thread yang memanggil start(), jadi panggil dari thread pipeline.
+        """
+        if not self.enabled:
+            return
+        self.reset()
+        if self.trace_memory:
+            tracemalloc.start()
+        if self.profile:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def stop(self):
+        """Menghentikan cProfile dan tracemalloc lalu menyimpan hasilnya."""
+        profiler, self.profiler = self.profiler, None
+        if profiler is not None:
+            profiler.disable()
+        if self.trace_memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            statistics = tracemalloc.take_snapshot().statistics('lineno')
+            tracemalloc.stop()
+            # Alokasi milik cProfile sendiri tidak ditampilkan
+            excluded = {cProfile.__file__, pstats.__file__}
+            top = [stat for stat in statistics if stat.traceback[0].filename not in excluded][:MEMORY_TOP_SITES]
+            self.memory = {
+                'saat_ini_mb': current / (1 << 20),
+                'puncak_mb': peak / (1 << 20),
+                'alokasi_teratas': [{'lokasi': str(stat.traceback[0]), 'mb': stat.size / (1 << 20), 'jumlah': stat.count}
+                                    for stat in top],
+            }
+        if profiler is not None:
+            self.profile_stats = pstats.Stats(profiler)
+
+    def stage(self, name):
+        """Context manager yang menambahkan durasi blok ke timer tahap `name`."""
+        if not self.enabled:
+            return _DISABLED_STAGE
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                timer = self.timers[name]
+                timer[0] += elapsed
+                timer[1] += 1
+
+    def count(self, name, n=1):
+        if self.enabled:
+            with self._lock:
+                self.counters[name] += n
+
+    def count_lookups(self, model, codes):
+        """Mencatat lookup likelihood dan lookup fallback (per baris, atribut, dan kelas) untuk satu batch kode."""
+        if self.enabled:
+            n_classes = len(model.classes)
+            self.count('lookup_likelihood', codes.size * n_classes)
+            self.count('lookup_fallback', model.unseen_count(codes) * n_classes)
+
+    def iterate(self, name, iterable):
+        """Mengembalikan iterable yang waktu setiap next()-nya dicatat di tahap `name` (misalnya parse per chunk)."""
+        if not self.enabled:
+            return iterable
+        return self._timed_iteration(name, iterable)
+
+    def _timed_iteration(self, name, iterable):
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def top_functions(self):
+        """Fungsi teratas hasil cProfile berdasarkan cumulative time."""
+        if self.profile_stats is None:
+            return []
+        rows = []
+        for (file_name, line, function), (_, calls, total, cumulative, _) in self.profile_stats.stats.items():
+            rows.append({'fungsi': f"{file_name}:{line}({function})", 'panggilan': calls,
+                         'tottime': total, 'cumtime': cumulative})
+        rows.sort(key=lambda row: row['cumtime'], reverse=True)
+        return rows[:PROFILE_TOP_FUNCTIONS]
+
+    def to_dict(self):
+        """Hasil instrumentasi dalam bentuk yang bisa ditulis sebagai JSON."""
+        with self._lock:
+            result = {
+                'tahap': {name: {'detik': total, 'panggilan': calls} for name, (total, calls) in self.timers.items()},
+                'counter': dict(self.counters),
+            }
+        if self.profile_stats is not None:
+            result['profil'] = self.top_functions()
+        if self.memory is not None:
+            result['memori'] = self.memory
+        return result
+
+    def summary_lines(self):
+        """Ringkasan hasil instrumentasi untuk ditampilkan sebagai teks (panel statistik GUI)."""
+        result = self.to_dict()
+        lines = ["Tahap:"]
+        for name, timer in result['tahap'].items():
+            lines.append(f"  {name:<18}{timer['detik']:>10.4f} detik  ({timer['panggilan']}x)")
+        lines.append("Counter:")
+        for name, value in result['counter'].items():
+            lines.append(f"  {name:<30}{value:>12}")
+        if self.memory is not None:
+            lines.append(f"Memori (tracemalloc): puncak {self.memory['puncak_mb']:.2f} MB")
+            for site in self.memory['alokasi_teratas']:
+                lines.append(f"  {site['mb']:>8.2f} MB  {site['lokasi']}")
+        if self.profile_stats is not None:
+            output = io.StringIO()
+            self.profile_stats.stream = output
+            self.profile_stats.sort_stats('cumulative').print_stats(PROFILE_TOP_FUNCTIONS)
+            lines.append("Profil (cProfile):")
+            lines.extend(output.getvalue().strip().splitlines())
+        return lines
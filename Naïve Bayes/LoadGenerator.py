@@ -0,0 +1,125 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+import numpy as np
+
+from DataLoader import DataReader
+
+
+def sample_rows(file_path, n_rows):
+    """Mengambil paling banyak n_rows baris pertama file data sebagai dict atribut -> nilai."""
+    reader = DataReader(file_path)
+    rows = []
+    for _, values in reader.iter_rows():
+        rows.append(dict(zip(reader.attributes, values)))
+        if len(rows) >= n_rows:
+            break
+    if not rows:
+        raise ValueError("Tidak ada data valid ditemukan setelah header.")
+    return rows
+
+
+async def open_connection(args):
+    if args.unix:
+        return await asyncio.open_unix_connection(args.unix)
+    return await asyncio.open_connection(args.host, args.port)
+
+
+async def close_connection(writer):
+    """Menutup koneksi dan menunggu transport benar-benar tertutup."""
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except ConnectionError:
+        pass # Server sudah memutus koneksi
+
+
+async def request(reader, writer, method, path, payload=None):
+    """Mengirim satu request HTTP/1.1 (keep-alive) dan mengembalikan (status, body JSON)."""
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8') if payload is not None else b''
+    writer.write((f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+                  f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n").encode('latin-1') + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def client(args, rows, counter, latencies):
+    """Satu klien: mengirim request berurutan di satu koneksi hingga kuota request habis."""
+    reader, writer = await open_connection(args)
+    try:
+        while counter[0] < args.requests:
+            i = counter[0]
+            counter[0] += 1
+            start = i * args.batch_size % len(rows)
+            batch = [rows[(start + j) % len(rows)] for j in range(args.batch_size)]
+            payload = batch[0] if args.batch_size == 1 else batch
+            t = time.perf_counter()
+            status, result = await request(reader, writer, 'POST', '/predict', payload)
+            latencies.append(time.perf_counter() - t)
+            if status != 200:
+                raise RuntimeError(f"Request gagal ({status}): {result.get('error')}")
+    finally:
+        await close_connection(writer)
+
+
+async def run(args):
+    rows = sample_rows(args.data, args.sample_rows)
+    counter = [0] # Jumlah request yang sudah diambil oleh klien
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(args, rows, counter, latencies) for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+
+    reader, writer = await open_connection(args)
+    _, server_stats = await request(reader, writer, 'GET', '/stats')
+    await close_connection(writer)
+
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        'klien': {
+            'request': len(latencies),
+            'baris': len(latencies) * args.batch_size,
+            'konkurensi': args.concurrency,
+            'durasi_detik': elapsed,
+            'request_per_detik': len(latencies) / elapsed,
+            'baris_per_detik': len(latencies) * args.batch_size / elapsed,
+            'latensi_ms': dict(zip(['p50', 'p99'], np.percentile(latencies_ms, [50, 99]).tolist())),
+        },
+        'server': server_stats,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generator beban untuk layanan scoring (NaiveBayesCLI.py serve).")
+    parser.add_argument('data', help="File data berformat ';' sebagai sumber baris request")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--unix', help="Path Unix socket layanan")
+    parser.add_argument('--concurrency', type=int, default=32, help="Jumlah klien bersamaan")
+    parser.add_argument('--requests', type=int, default=10000, help="Jumlah total request")
+    parser.add_argument('--batch-size', type=int, default=1, help="Jumlah baris per request")
+    parser.add_argument('--sample-rows', type=int, default=10000, help="Jumlah baris file yang dipakai sebagai sampel")
+    args = parser.parse_args(argv)
+    try:
+        result = asyncio.run(run(args))
+    except (FileNotFoundError, ValueError, ConnectionError, RuntimeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
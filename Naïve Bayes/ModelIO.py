@@ -0,0 +1,158 @@
+import json
+import mmap
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+from DataLoader import HASHED
+from NaiveBayesModel import NaiveBayesModel, SparseCounts
+
+
+MAGIC = b'NBMODEL\x01' # Penanda format file model, versi 1
+ALIGNMENT = 64 # Setiap array dimulai di offset kelipatan 64 byte
+HEADER_LENGTH = struct.Struct('<Q') # Panjang header JSON (uint64 little-endian)
+
+
+def _align(position):
+    return (position + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _umask():
+    # mkstemp membuat file dengan mode 0600; file model mengikuti umask seperti open() biasa
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def save_model(model, model_path):
+    """Menyimpan model ke file biner: header JSON (atribut, kelas, vocabulary, posisi array)
+    diikuti array hitungan dan tabel log-likelihood float64 yang bersebelahan di file.
+
+    Model sparse hanya menyimpan entri bukan nol (kode nilai, kode kelas, hitungan) per atribut
+    tanpa tabel log-likelihood; tabelnya dihitung ulang dari entri tersebut saat dimuat.
+    """
+    model._ensure_tables()
+    arrays = {
+        'class_counts': np.ascontiguousarray(model.class_counts, dtype='<i8'),
+        'log_priors': np.ascontiguousarray(model.log_priors, dtype='<f8'),
+    }
+    if not model.sparse:
+        # log_table berbentuk (sum(|V_X| + 1), C) dan diindeks oleh (atribut, kode nilai, kelas)
+        arrays['log_table'] = np.ascontiguousarray(model.log_table, dtype='<f8')
+    for a, counts in enumerate(model.value_counts):
+        if model.sparse:
+            arrays[f'value_codes_{a}'] = np.ascontiguousarray(counts.values, dtype='<i8')
+            arrays[f'class_codes_{a}'] = np.ascontiguousarray(counts.classes, dtype='<i8')
+            arrays[f'value_counts_{a}'] = np.ascontiguousarray(counts.counts, dtype='<i8')
+        else:
+            arrays[f'value_counts_{a}'] = np.ascontiguousarray(counts, dtype='<i8')
+    if model.gaussian_index:
+        # Momen atribut gaussian per kelas, bentuk (C, G)
+        arrays['numeric_counts'] = np.ascontiguousarray(model.numeric_counts, dtype='<i8')
+        arrays['numeric_means'] = np.ascontiguousarray(model.numeric_means, dtype='<f8')
+        arrays['numeric_m2'] = np.ascontiguousarray(model.numeric_m2, dtype='<f8')
+
+    # Posisi array dihitung relatif terhadap akhir header; header diisi spasi hingga kelipatan ALIGNMENT
+    layout = {}
+    position = 0
+    for name, array in arrays.items():
+        position = _align(position)
+        layout[name] = {'offset': position, 'dtype': array.dtype.str, 'shape': list(array.shape)}
+        position += array.nbytes
+
+    header = {
+        'attribute_list': model.attribute_list,
+        'classes': model.classes,
+        # Vocabulary atribut hashed hanya berupa jumlah bucket (hash_buckets)
+        'vocabularies': [[] if attribute_type == HASHED else vocabulary
+                         for attribute_type, vocabulary in zip(model.attribute_types, model.vocabularies)],
+        'attribute_types': model.attribute_types,
+        'sparse': model.sparse,
+        'hash_buckets': model.hash_buckets,
+        'bin_edges': [None if edges is None else edges.tolist() for edges in model.bin_edges],
+        'arrays': layout,
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+    data_start = _align(len(MAGIC) + HEADER_LENGTH.size + len(header_bytes))
+    header_bytes += b' ' * (data_start - len(MAGIC) - HEADER_LENGTH.size - len(header_bytes))
+
+    # File ditulis ke file sementara di direktori yang sama lalu diganti secara atomik, sehingga
+    # proses lain yang sedang me-mmap model lama tetap membaca file utuh (tidak terpotong)
+    directory = os.path.dirname(os.path.abspath(model_path))
+    descriptor, temp_path = tempfile.mkstemp(prefix='.' + os.path.basename(model_path) + '.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(descriptor, 'wb') as f:
+            f.write(MAGIC)
+            f.write(HEADER_LENGTH.pack(len(header_bytes)))
+            f.write(header_bytes)
+            for name, array in arrays.items():
+                f.write(b'\0' * (data_start + layout[name]['offset'] - f.tell()))
+                f.write(array.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, 0o666 & ~_umask())
+        os.replace(temp_path, model_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load_model(model_path, use_mmap=True):
+    """Memuat model dari file hasil save_model().
+
+    Dengan use_mmap=True array hitungan dan tabel log-likelihood adalah view read-only dari
+    file yang di-mmap (tanpa salinan), sehingga beberapa proses yang memuat file yang sama
+    berbagi satu salinan di page cache. Perubahan lewat partial_fit()/merge() membuat salinan.
+    """
+    with open(model_path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{model_path} bukan file model Naive Bayes.")
+        (header_length,) = HEADER_LENGTH.unpack(f.read(HEADER_LENGTH.size))
+        header = json.loads(f.read(header_length).decode('utf-8'))
+        data_start = len(MAGIC) + HEADER_LENGTH.size + header_length
+        if use_mmap:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            f.seek(0)
+            buffer = f.read()
+
+    def array(name):
+        spec = header['arrays'][name]
+        dtype = np.dtype(spec['dtype'])
+        count = int(np.prod(spec['shape']))
+        return np.frombuffer(buffer, dtype=dtype, count=count, offset=data_start + spec['offset']).reshape(spec['shape'])
+
+    attribute_list = header['attribute_list']
+    # File model lama tidak memiliki tipe atribut (semua kategorikal)
+    numeric_moments = None
+    if 'numeric_counts' in header['arrays']:
+        numeric_moments = (array('numeric_counts'), array('numeric_means'), array('numeric_m2'))
+    hash_buckets = header.get('hash_buckets', 0)
+    if header.get('sparse'):
+        attribute_types = header['attribute_types']
+        value_counts = []
+        for a, (attribute_type, vocabulary) in enumerate(zip(attribute_types, header['vocabularies'])):
+            shape = (len(header['classes']), hash_buckets if attribute_type == HASHED else len(vocabulary))
+            value_counts.append(SparseCounts(shape, array(f'value_codes_{a}'), array(f'class_codes_{a}'), array(f'value_counts_{a}')))
+        log_table = None
+    else:
+        value_counts = [array(f'value_counts_{a}') for a in range(len(attribute_list))]
+        log_table = array('log_table')
+    return NaiveBayesModel.from_arrays(
+        attribute_list,
+        header['classes'],
+        header['vocabularies'],
+        array('class_counts'),
+        value_counts,
+        log_priors=array('log_priors'),
+        log_table=log_table,
+        attribute_types=header.get('attribute_types'),
+        bin_edges=header.get('bin_edges'),
+        numeric_moments=numeric_moments,
+        hash_buckets=hash_buckets,
+    )
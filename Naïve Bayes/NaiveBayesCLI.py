@@ -0,0 +1,341 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from CrossValidation import EncodedDataset, cross_validate
+from DataLoader import CATEGORICAL, DEFAULT_BINS, DEFAULT_CHUNK_SIZE, NUMERIC_MODES, DataReader
+from Evaluation import ConfusionMatrix
+from Instrumentation import Instrumentation
+from ModelIO import load_model, save_model
+from NaiveBayesModel import NaiveBayesModel
+from ParallelTraining import fit_parallel
+from ScoringService import DEFAULT_MAX_BATCH_ROWS, DEFAULT_MAX_DELAY, run_service
+
+
+def warn(message):
+    """Menulis peringatan ke stderr."""
+    print(message, file=sys.stderr)
+
+
+def counting_warn(instrumentation):
+    """on_warning untuk DataReader: menulis peringatan dan menghitung baris yang dilewati."""
+    def on_warning(message):
+        instrumentation.count('baris_dilewati')
+        warn(message)
+    return on_warning
+
+
+def write_stats(instrumentation, stats_path):
+    """Menulis hasil instrumentasi sebagai JSON ke file, atau ke stderr jika stats_path '-'."""
+    text = json.dumps(instrumentation.to_dict(), ensure_ascii=False, indent=2)
+    if stats_path == '-':
+        warn(text)
+    else:
+        with open(stats_path, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+
+
+def report_throughput(label, rows, elapsed):
+    """Menulis jumlah baris, waktu, dan throughput (baris/detik) ke stderr."""
+    rate = rows / elapsed if elapsed > 0 else float('inf')
+    warn(f"{label}: {rows} baris dalam {elapsed:.3f} detik ({rate:,.0f} baris/detik)")
+
+
+def report_cache(model):
+    """Menulis statistik cache prediksi ke stderr jika cache dipakai."""
+    if model.cache_size > 0:
+        cache_info = model.cache_info()
+        warn(f"Cache prediksi: {cache_info.hits} hit, {cache_info.misses} miss ({cache_info.currsize}/{cache_info.maxsize} kombinasi nilai)")
+
+
+def format_mean_std(mean, std, decimals):
+    """Menampilkan 'rata-rata ± simpangan baku', atau '-' jika metrik tidak tersedia (None)."""
+    if mean is None:
+        return "-"
+    return f"{round(mean, decimals)} ± {round(std, decimals)}"
+
+
+def numeric_mode(args):
+    """Mode atribut numerik dari opsi --numeric (None jika 'off')."""
+    return None if args.numeric == 'off' else args.numeric
+
+
+def open_reader(file_path, model, chunk_size, labeled=None, on_warning=warn):
+    """Membuka DataReader yang memakai vocabulary model.
+
+    Jika labeled None, file boleh memiliki kolom hipotesis atau tidak (ditentukan dari header).
+    """
+    try:
+        return DataReader(file_path, chunk_size=chunk_size, on_warning=on_warning, model=model)
+    except ValueError as error:
+        if labeled:
+            raise
+        try:
+            return DataReader(file_path, chunk_size=chunk_size, on_warning=on_warning, model=model, labeled=False)
+        except ValueError:
+            raise error
+
+
+def cmd_train(args):
+    """Melatih model dari file data dan menyimpannya."""
+    stage = args.instrumentation.stage
+    start = time.perf_counter()
+    with stage('train'): # Termasuk membaca file, karena training dilakukan per chunk
+        if args.workers > 1:
+            model = fit_parallel(args.data, n_workers=args.workers, chunk_size=args.chunk_size, on_warning=args.on_warning,
+                                 numeric_mode=numeric_mode(args), n_bins=args.bins, hash_buckets=args.hash_buckets,
+                                 sparse=args.sparse)
+        else:
+            reader = DataReader(args.data, chunk_size=args.chunk_size, on_warning=args.on_warning,
+                                numeric_mode=numeric_mode(args), n_bins=args.bins, hash_buckets=args.hash_buckets)
+            model = NaiveBayesModel(reader.attribute_list, sparse=args.sparse).fit_chunks(reader)
+    elapsed = time.perf_counter() - start
+    args.instrumentation.count('baris_dibaca', model.total_instances)
+    with stage('save'):
+        save_model(model, args.model)
+    report_throughput("Training", model.total_instances, elapsed)
+    typed = [f"{attr} ({attribute_type})" for attr, attribute_type in zip(model.attribute_list, model.attribute_types)
+             if attribute_type != CATEGORICAL]
+    if typed:
+        warn(f"Atribut numerik/hashed: {', '.join(typed)}")
+    warn(f"Model disimpan ke {args.model} ({len(model.classes)} kelas, {len(model.attribute_list)} atribut, "
+         f"{model.nbytes / (1 << 20):.2f} MB hitungan dan tabel{', sparse' if model.sparse else ''})")
+    return 0
+
+
+def cmd_score(args):
+    """Memprediksi setiap baris file data dan menulis hasilnya baris demi baris."""
+    instrumentation = args.instrumentation
+    with instrumentation.stage('load_model'):
+        model = load_model(args.model)
+    model.set_cache_size(args.cache_size)
+    reader = open_reader(args.data, model, args.chunk_size, on_warning=args.on_warning)
+    output = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    rows = 0
+    start = time.perf_counter()
+    try:
+        if args.format == 'csv':
+            writer = csv.writer(output)
+            writer.writerow([reader.attributes[0], "Prediksi"] + [f"P({class_label}) %" for class_label in model.classes])
+        for chunk in instrumentation.iterate('parse', reader.iter_chunks()):
+            with instrumentation.stage('score'):
+                probabilities = model.predict_proba_encoded(chunk.codes, chunk.numbers)
+                predicted = probabilities.argmax(axis=1)
+                percentages = np.round(probabilities * 100, args.decimals)
+            instrumentation.count_lookups(model, chunk.codes)
+            with instrumentation.stage('write'):
+                for instance_id, c, row in zip(chunk.ids, predicted.tolist(), percentages.tolist()):
+                    if args.format == 'csv':
+                        writer.writerow([instance_id, model.classes[c]] + row)
+                    else:
+                        output.write(json.dumps({
+                            "id": instance_id,
+                            "prediksi": model.classes[c],
+                            "probabilitas": dict(zip(model.classes, row)),
+                        }, ensure_ascii=False) + "\n")
+            rows += len(chunk.ids)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    instrumentation.count('baris_dibaca', rows)
+    report_throughput("Scoring", rows, time.perf_counter() - start)
+    report_cache(model)
+    return 0
+
+
+def cmd_evaluate(args):
+    """Menghitung confusion matrix, akurasi, presisi, recall, dan F1 model pada file data berlabel."""
+    instrumentation = args.instrumentation
+    with instrumentation.stage('load_model'):
+        model = load_model(args.model)
+    model.set_cache_size(args.cache_size)
+    reader = open_reader(args.data, model, args.chunk_size, labeled=True, on_warning=args.on_warning)
+    n_classes = len(model.classes)
+    confusion = ConfusionMatrix(model.classes) # Kode kelas sama dengan kode kelas model
+    start = time.perf_counter()
+    for chunk in instrumentation.iterate('parse', reader.iter_chunks()):
+        with instrumentation.stage('score'):
+            predicted = model.predict_encoded(chunk.codes, chunk.numbers)
+        instrumentation.count_lookups(model, chunk.codes)
+        with instrumentation.stage('confusion_matrix'):
+            actual = chunk.class_codes.astype(np.int64)
+            if (actual >= n_classes).any():
+                # Kelas yang tidak ada di training (kode C) dicatat sebagai satu baris tambahan
+                actual[actual >= n_classes] = confusion.add_class("(kelas lain)")
+            confusion.update(actual, predicted)
+    elapsed = time.perf_counter() - start
+    instrumentation.count('baris_dibaca', confusion.total)
+
+    with instrumentation.stage('metrics'):
+        result = confusion.to_dict()
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        d = args.decimals
+        print("Confusion Matrix (Baris: Aktual, Kolom: Prediksi):")
+        row_format = "{:<15}" * (len(confusion.classes) + 1)
+        print(row_format.format("Aktual", *confusion.classes))
+        for actual, row in result["confusion_matrix"].items():
+            print(row_format.format(actual, *[str(count) for count in row.values()]))
+        print(f"\nAkurasi = {confusion.correct} / {confusion.total} = {round(result['akurasi'], d)}")
+        for class_label in model.classes:
+            metrics = result["per_kelas"][class_label]
+            print(f"Untuk Hipotesis: {class_label}")
+            print(f"  Presisi = {round(metrics['presisi'], d)}")
+            print(f"  Recall  = {round(metrics['recall'], d)}")
+            print(f"  F1      = {round(metrics['f1'], d)}")
+        for average in ('macro', 'micro'):
+            values = result[average]
+            print(f"Rata-rata {average}: Presisi = {round(values['precision'], d)}, Recall = {round(values['recall'], d)}, F1 = {round(values['f1'], d)}")
+    report_throughput("Evaluasi", confusion.total, elapsed)
+    report_cache(model)
+    return 0
+
+
+def cmd_crossval(args):
+    """Menjalankan stratified k-fold atau repeated holdout dan menampilkan rata-rata serta simpangan baku metrik."""
+    stage = args.instrumentation.stage
+    with stage('parse'):
+        dataset = EncodedDataset.from_file(args.data, chunk_size=args.chunk_size, on_warning=args.on_warning,
+                                           numeric_mode=numeric_mode(args), n_bins=args.bins, hash_buckets=args.hash_buckets)
+    args.instrumentation.count('baris_dibaca', len(dataset.class_codes))
+    start = time.perf_counter()
+    with stage('crossval'):
+        result = cross_validate(dataset, n_folds=args.folds, repeats=args.repeats, test_fraction=args.holdout,
+                                seed=args.seed, n_workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        d = args.decimals
+        mode = f"repeated holdout {args.holdout:.0%} testing" if args.holdout is not None else f"stratified {args.folds}-fold"
+        print(f"Cross-validation: {mode}, {args.repeats} ulangan, {len(result['folds'])} evaluasi")
+        print("Confusion Matrix gabungan (Baris: Aktual, Kolom: Prediksi):")
+        row_format = "{:<15}" * (len(result['classes']) + 1)
+        print(row_format.format("Aktual", *result['classes']))
+        for actual, row in result['confusion_matrix'].items():
+            print(row_format.format(actual, *[str(count) for count in row.values()]))
+        mean, std = result['mean'], result['std']
+        print(f"\nAkurasi = {format_mean_std(mean['accuracy'], std['accuracy'], d)}")
+        for class_label in result['classes']:
+            print(f"Untuk Hipotesis: {class_label}")
+            print(f"  Presisi = {format_mean_std(mean['precision'][class_label], std['precision'][class_label], d)}")
+            print(f"  Recall  = {format_mean_std(mean['recall'][class_label], std['recall'][class_label], d)}")
+            print(f"  F1      = {format_mean_std(mean['f1'][class_label], std['f1'][class_label], d)}")
+        print(f"F1 macro = {format_mean_std(mean['macro_f1'], std['macro_f1'], d)}")
+    report_throughput("Cross-validation", len(dataset.class_codes) * args.repeats, elapsed)
+    return 0
+
+
+def cmd_serve(args):
+    """Menjalankan layanan scoring lokal hingga dihentikan dengan Ctrl+C."""
+    model = load_model(args.model)
+    model.set_cache_size(args.cache_size)
+    stats = run_service(model, host=args.host, port=args.port, unix_path=args.unix,
+                        max_batch_rows=args.max_batch_rows, max_delay=args.max_delay_ms / 1000)
+    warn(json.dumps(stats.to_dict(), ensure_ascii=False))
+    return 0
+
+
+def add_numeric_arguments(parser):
+    parser.add_argument('--numeric', choices=list(NUMERIC_MODES) + ['off'], default=NUMERIC_MODES[0],
+                        help="Perlakuan kolom angka yang terdeteksi: distribusi normal per kelas, interval kuantil, "
+                             "atau semua atribut kategorikal (kolom berisi kode angka seperti ID sebaiknya memakai "
+                             "--hash-buckets atau --numeric off)")
+    parser.add_argument('--bins', type=int, default=DEFAULT_BINS, help="Jumlah interval kuantil untuk --numeric binned")
+    parser.add_argument('--hash-buckets', type=int, default=0,
+                        help="Atribut dengan nilai unik lebih dari jumlah ini di chunk pertama di-hash ke sejumlah "
+                             "bucket tersebut, termasuk kolom angka (diperiksa sebelum --numeric; 0 = tanpa hashing)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Naive Bayes Classifier tanpa GUI untuk file data berformat ';'.")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="Jumlah baris per chunk saat membaca file")
+    parser.add_argument('--stats', metavar='FILE', help="Tulis timer tahap dan counter sebagai JSON ke file ('-' untuk stderr)")
+    parser.add_argument('--profile', action='store_true', help="Sertakan profil cProfile di statistik")
+    parser.add_argument('--trace-memory', action='store_true', help="Sertakan puncak memori dan lokasi alokasi teratas (tracemalloc) di statistik")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    train_parser = subparsers.add_parser('train', help="Melatih model dan menyimpannya ke file")
+    train_parser.add_argument('data', help="File data training")
+    train_parser.add_argument('model', help="File model keluaran")
+    train_parser.add_argument('--workers', type=int, default=1, help="Jumlah proses untuk training paralel")
+    add_numeric_arguments(train_parser)
+    train_parser.add_argument('--sparse', action='store_true',
+                              help="Simpan hanya hitungan (nilai, kelas) bukan nol, untuk atribut berkardinalitas tinggi")
+    train_parser.set_defaults(func=cmd_train)
+
+    score_parser = subparsers.add_parser('score', help="Memprediksi setiap baris file data")
+    score_parser.add_argument('model', help="File model hasil perintah train")
+    score_parser.add_argument('data', help="File data (kolom hipotesis boleh tidak ada)")
+    score_parser.add_argument('-o', '--output', help="File keluaran (default: stdout)")
+    score_parser.add_argument('--format', choices=['csv', 'jsonl'], default='csv', help="Format keluaran")
+    score_parser.add_argument('--decimals', type=int, default=2, help="Jumlah desimal persentase")
+    score_parser.add_argument('--cache-size', type=int, default=0, help="Ukuran cache prediksi LRU per kombinasi nilai (0 = tanpa cache)")
+    score_parser.set_defaults(func=cmd_score)
+
+    evaluate_parser = subparsers.add_parser('evaluate', help="Mengevaluasi model pada file data berlabel")
+    evaluate_parser.add_argument('model', help="File model hasil perintah train")
+    evaluate_parser.add_argument('data', help="File data berlabel")
+    evaluate_parser.add_argument('--json', action='store_true', help="Tulis hasil dalam format JSON")
+    evaluate_parser.add_argument('--decimals', type=int, default=2, help="Jumlah desimal untuk tampilan")
+    evaluate_parser.add_argument('--cache-size', type=int, default=0, help="Ukuran cache prediksi LRU per kombinasi nilai (0 = tanpa cache)")
+    evaluate_parser.set_defaults(func=cmd_evaluate)
+
+    crossval_parser = subparsers.add_parser('crossval', help="Stratified k-fold / repeated holdout cross-validation")
+    crossval_parser.add_argument('data', help="File data berlabel")
+    crossval_parser.add_argument('--folds', type=int, default=5, help="Jumlah fold")
+    crossval_parser.add_argument('--repeats', type=int, default=1, help="Jumlah ulangan dengan pengacakan berbeda")
+    crossval_parser.add_argument('--holdout', type=float, help="Proporsi data testing untuk repeated holdout (mis. 0.3) sebagai ganti k-fold")
+    crossval_parser.add_argument('--seed', type=int, default=0, help="Seed pengacakan")
+    crossval_parser.add_argument('--workers', type=int, default=1, help="Jumlah proses untuk menjalankan fold secara paralel")
+    add_numeric_arguments(crossval_parser)
+    crossval_parser.add_argument('--json', action='store_true', help="Tulis hasil dalam format JSON")
+    crossval_parser.add_argument('--decimals', type=int, default=2, help="Jumlah desimal untuk tampilan")
+    crossval_parser.set_defaults(func=cmd_crossval)
+
+    serve_parser = subparsers.add_parser('serve', help="Menjalankan layanan scoring HTTP lokal dengan micro-batching")
+    serve_parser.add_argument('model', help="File model hasil perintah train")
+    serve_parser.add_argument('--host', default='127.0.0.1', help="Alamat yang didengarkan")
+    serve_parser.add_argument('--port', type=int, default=8000, help="Port TCP")
+    serve_parser.add_argument('--unix', help="Path Unix socket sebagai ganti host/port")
+    serve_parser.add_argument('--max-batch-rows', type=int, default=DEFAULT_MAX_BATCH_ROWS, help="Jumlah baris maksimum per micro-batch")
+    serve_parser.add_argument('--max-delay-ms', type=float, default=DEFAULT_MAX_DELAY * 1000, help="Waktu tunggu maksimum untuk mengisi micro-batch (ms)")
+    serve_parser.add_argument('--cache-size', type=int, default=0, help="Ukuran cache prediksi LRU per kombinasi nilai (0 = tanpa cache)")
+    serve_parser.set_defaults(func=cmd_serve)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    # Tanpa --stats/--profile/--trace-memory instrumentasi nonaktif dan hampir tanpa biaya
+    args.instrumentation = Instrumentation(enabled=args.stats is not None, profile=args.profile, trace_memory=args.trace_memory)
+    args.on_warning = counting_warn(args.instrumentation)
+    args.instrumentation.start()
+    try:
+        status = args.func(args)
+        sys.stdout.flush() # Pipa yang tertutup di akhir output juga ditangani di bawah
+    except BrokenPipeError:
+        # Pembaca output berhenti lebih awal (mis. '| head'); sisa output dibuang ke devnull agar
+        # flush saat interpreter keluar tidak memicu BrokenPipeError lagi
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        status = 1
+    except (FileNotFoundError, ValueError) as e:
+        warn(f"Error: {e}")
+        status = 1 # Statistik tetap ditulis agar run yang gagal juga bisa dianalisis
+    finally:
+        args.instrumentation.stop()
+    if args.instrumentation.enabled:
+        write_stats(args.instrumentation, args.stats or '-')
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,765 @@
+import math
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+from DataLoader import (BINNED, CATEGORICAL, DEFAULT_BINS, GAUSSIAN, HASHED, HashedVocabulary, attribute_vocabulary,
+                        detect_attribute_types, encode_column, encode_values, parse_numbers, quantile_edges,
+                        vocabulary_index)
+
+
+UNKNOWN_CLASS = "Tidak Diketahui" # Hasil prediksi jika model belum memiliki kelas
+VAR_SMOOTHING = 1e-9 # Bagian dari varians terbesar yang ditambahkan ke setiap varians gaussian (seperti scikit-learn)
+
+# Statistik cache prediksi, sama seperti functools.lru_cache().cache_info()
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class SparseCounts:
+    """Matriks hitungan count(X=v and C=c) berbentuk (C, |V_X|) yang hanya menyimpan entri bukan nol.
+
+    Entri disimpan sebagai tiga array sejajar (kode nilai, kode kelas, hitungan) yang diurutkan
+    per nilai lalu per kelas, sehingga memorinya sebanding dengan jumlah pasangan (nilai, kelas)
+    yang benar-benar muncul, bukan C x |V_X|.
+    """
+
+    def __init__(self, shape, values=None, classes=None, counts=None):
+        self.shape = tuple(shape)
+        self.values = np.zeros(0, dtype=np.int64) if values is None else values
+        self.classes = np.zeros(0, dtype=np.int64) if classes is None else classes
+        self.counts = np.zeros(0, dtype=np.int64) if counts is None else counts
+
+    @classmethod
+    def from_pairs(cls, shape, values, classes, counts):
+        """Membangun dari pasangan (nilai, kelas, hitungan) yang boleh berulang dan tidak urut."""
+        values = np.asarray(values, dtype=np.int64)
+        classes = np.asarray(classes, dtype=np.int64)
+        keys, inverse = np.unique(values * shape[0] + classes, return_inverse=True)
+        totals = np.bincount(inverse.reshape(-1), weights=counts, minlength=len(keys)).astype(np.int64)
+        return cls(shape, keys // shape[0], keys % shape[0], totals)
+
+    @classmethod
+    def from_codes(cls, value_codes, class_codes, shape):
+        """Menghitung entri bukan nol dari kode nilai dan kode kelas satu batch data."""
+        keys, counts = np.unique(np.asarray(value_codes, dtype=np.int64) * shape[0] + class_codes, return_counts=True)
+        return cls(shape, keys // shape[0], keys % shape[0], counts.astype(np.int64))
+
+    @classmethod
+    def from_dense(cls, counts):
+        classes, values = np.nonzero(counts)
+        order = np.lexsort((classes, values))
+        return cls(counts.shape, values[order], classes[order], np.asarray(counts)[classes[order], values[order]].astype(np.int64))
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes + self.classes.nbytes + self.counts.nbytes
+
+    def grow(self, shape):
+        """Matriks yang sama dengan bentuk lebih besar (kelas atau nilai baru, hitungan 0)."""
+        return SparseCounts(shape, self.values, self.classes, self.counts)
+
+    def remap(self, class_map, value_map, shape):
+        """Memetakan kode kelas dan nilai ke kode lain (misalnya saat merge())."""
+        return SparseCounts.from_pairs(shape, value_map[self.values], class_map[self.classes], self.counts)
+
+    def __add__(self, other):
+        return SparseCounts.from_pairs(self.shape, np.concatenate([self.values, other.values]),
+                                       np.concatenate([self.classes, other.classes]),
+                                       np.concatenate([self.counts, other.counts]))
+
+    def __getitem__(self, index):
+        """count(X=v and C=c) untuk indeks (c, v)."""
+        c, v = index
+        start, end = np.searchsorted(self.values, [v, v + 1])
+        position = start + np.searchsorted(self.classes[start:end], c)
+        return self.counts[position] if position < end and self.classes[position] == c else np.int64(0)
+
+    def toarray(self):
+        dense = np.zeros(self.shape, dtype=np.int64)
+        dense[self.classes, self.values] = self.counts
+        return dense
+
+
+class NaiveBayesModel:
+    """Model Naive Bayes kategorikal dengan Laplace smoothing, terpisah dari GUI.
+
+    Setiap kolom atribut di-encode menjadi kode integer (dictionary encoding), lalu
+    jumlah data per kelas dan matriks hitungan kelas x nilai disimpan sebagai array
+    NumPy. Tabel likelihood dihitung sekali saat fit(), sehingga prediksi per baris
+    cukup satu lookup per atribut dan prediksi batch cukup satu gather-and-sum
+    atas array log-likelihood.
+
+    Prior dan likelihood disimpan dengan presisi penuh dan skor dihitung di ruang log
+    (normalisasi dengan log-sum-exp), sehingga dataset dengan banyak atribut tidak
+    mengalami underflow. Pembulatan hanya dilakukan saat menampilkan hasil.
+
+    Dengan cache_size > 0, skor log setiap kombinasi kode atribut disimpan di cache LRU
+    berukuran tetap, sehingga kombinasi nilai yang berulang cukup satu lookup dictionary.
+    Cache dikosongkan otomatis setiap kali tabel dihitung ulang (fit, partial_fit, merge).
+
+    Atribut numerik bertipe GAUSSIAN dimodelkan dengan distribusi normal per kelas dari jumlah,
+    rata-rata, dan M2 yang diakumulasi secara streaming (rumus Chan), sedangkan atribut BINNED
+    dikelompokkan ke interval kuantil lalu diperlakukan seperti atribut kategorikal. Ukuran model
+    keduanya tidak bergantung pada jumlah nilai unik. Dengan numeric_mode, tipe atribut dideteksi
+    dari data saat fit() (lihat DataLoader.detect_attribute_types()).
+
+    Dengan sparse=True hitungan nilai disimpan sebagai SparseCounts (hanya entri bukan nol) dan
+    tabel log-likelihood tidak dibentuk rapat: skor dihitung dari log(1 / (N_class + |V_X|)) per
+    atribut ditambah log(count + 1) untuk entri yang ada. Dengan hash_buckets > 0, atribut
+    kategorikal yang nilai uniknya melebihi hash_buckets di-hash ke hash_buckets bucket (HASHED),
+    sehingga ukuran model per atribut dibatasi C x hash_buckets.
+    """
+
+    def __init__(self, attribute_list, cache_size=0, attribute_types=None, bin_edges=None, numeric_mode=None,
+                 n_bins=DEFAULT_BINS, sparse=False, hash_buckets=0):
+        self.attribute_list = list(attribute_list) # Atribut prediktor (selain ID dan kelas)
+        self.numeric_mode = numeric_mode # GAUSSIAN, BINNED, atau None (semua atribut kategorikal)
+        self.n_bins = n_bins
+        self.sparse = sparse
+        self.hash_buckets = hash_buckets # Jumlah bucket atribut hashed (0 = tanpa hashing)
+        self._set_types(attribute_types, bin_edges)
+        self.set_cache_size(cache_size)
+        self._reset()
+
+    def _set_types(self, attribute_types=None, bin_edges=None):
+        """Mengatur tipe atribut dan batas interval atribut binned (None = belum diketahui)."""
+        self.attribute_types = list(attribute_types) if attribute_types else [CATEGORICAL] * len(self.attribute_list)
+        self.bin_edges = [None if edges is None else np.asarray(edges, dtype=np.float64)
+                          for edges in (bin_edges or [None] * len(self.attribute_list))]
+        self.gaussian_index = [a for a, attribute_type in enumerate(self.attribute_types) if attribute_type == GAUSSIAN]
+
+    def _reset(self):
+        """Mengosongkan seluruh hitungan dan tabel model."""
+        self.classes = [] # Label kelas, indeks list = kode kelas
+        self.class_index = {} # Label kelas -> kode kelas
+        # Nilai unik per atribut, indeks list = kode nilai. Atribut binned dan hashed berisi label
+        # interval/bucket dan atribut gaussian tidak memiliki vocabulary
+        self.vocabularies = [attribute_vocabulary(attribute_type, edges, self.hash_buckets)
+                             for attribute_type, edges in zip(self.attribute_types, self.bin_edges)]
+        self.value_index = [vocabulary_index(vocabulary) for vocabulary in self.vocabularies] # Nilai -> kode nilai, per atribut
+        self.class_counts = np.zeros(0, dtype=np.int64) # count(C=c), bentuk (C,)
+        # count(X=v and C=c), bentuk (C, |V_X|); SparseCounts jika sparse=True
+        self.value_counts = [self._empty_counts((0, len(vocabulary))) for vocabulary in self.vocabularies]
+        # Momen atribut gaussian per kelas, bentuk (C, G): jumlah nilai, rata-rata, dan M2 (jumlah kuadrat selisih)
+        G = len(self.gaussian_index)
+        self.numeric_counts = np.zeros((0, G), dtype=np.int64)
+        self.numeric_means = np.zeros((0, G))
+        self.numeric_m2 = np.zeros((0, G))
+        self.log_priors = np.zeros(0) # log P(class), bentuk (C,)
+        # Gabungan log-likelihood semua atribut, bentuk (sum(|V_X| + 1), C). Blok setiap atribut
+        # berisi |V_X| baris untuk nilai training dan satu baris fallback log((0 + 1) / (N_class + |V_X|))
+        # untuk nilai yang tidak ada di data training
+        self.log_table = np.zeros((0, 0))
+        self.offsets = np.zeros(0, dtype=np.int64) # Baris awal blok setiap atribut di log_table
+        # Tabel mode sparse: skor dasar log P(class) + sum log(1 / (N_class + |V_X|)) berbentuk (C,), lalu
+        # entri log(count + 1) per (baris blok, kelas) yang diurutkan per baris (indptr seperti CSR)
+        self.sparse_base = np.zeros(0)
+        self.sparse_indptr = np.zeros(1, dtype=np.int64)
+        self.sparse_classes = np.zeros(0, dtype=np.int64)
+        self.sparse_weights = np.zeros(0)
+        self._tables_stale = False # True jika hitungan berubah sejak tabel terakhir dihitung
+        self._cache = OrderedDict() # Tuple kode atribut -> skor log per kelas, urut dari yang paling lama dipakai
+
+    def __getstate__(self):
+        """State pickle yang ringkas: hanya vocabulary dan array hitungan.
+
+        Index nilai dan tabel likelihood dibangun ulang dari hitungan setelah unpickle,
+        sehingga model hasil training per shard murah dikirim antar proses.
+        """
+        return {
+            'attribute_list': self.attribute_list,
+            'classes': self.classes,
+            'vocabularies': self.vocabularies,
+            'class_counts': self.class_counts,
+            'value_counts': self.value_counts,
+            'attribute_types': self.attribute_types,
+            'bin_edges': self.bin_edges,
+            'numeric_mode': self.numeric_mode,
+            'n_bins': self.n_bins,
+            'numeric_moments': self.numeric_moments,
+            'sparse': self.sparse,
+            'hash_buckets': self.hash_buckets,
+        }
+
+    def __setstate__(self, state):
+        self.attribute_list = state['attribute_list']
+        self.numeric_mode = state.get('numeric_mode')
+        self.n_bins = state.get('n_bins', DEFAULT_BINS)
+        self.sparse = state.get('sparse', False)
+        self.hash_buckets = state.get('hash_buckets', 0)
+        self._set_types(state.get('attribute_types'), state.get('bin_edges'))
+        self.set_cache_size(0)
+        self._restore(state['classes'], state['vocabularies'], state['class_counts'], state['value_counts'],
+                      numeric_moments=state.get('numeric_moments'))
+
+    @classmethod
+    def from_arrays(cls, attribute_list, classes, vocabularies, class_counts, value_counts,
+                    log_priors=None, log_table=None, cache_size=0, attribute_types=None, bin_edges=None,
+                    numeric_moments=None, hash_buckets=0):
+        """Membangun model dari vocabulary dan array yang sudah ada (misalnya hasil ModelIO.load_model()).
+
+        Array dipakai apa adanya tanpa disalin, sehingga boleh berupa view read-only dari mmap.
+        Jika log_priors dan log_table tidak diberikan, tabel dihitung dari hitungan saat dibutuhkan.
+        numeric_moments adalah (jumlah, rata-rata, M2) atribut gaussian, masing-masing berbentuk (C, G).
+        Jika value_counts berisi SparseCounts, model memakai mode sparse.
+        """
+        model = cls.__new__(cls)
+        model.attribute_list = list(attribute_list)
+        model.numeric_mode = None
+        model.n_bins = DEFAULT_BINS
+        model.sparse = any(isinstance(counts, SparseCounts) for counts in value_counts)
+        model.hash_buckets = hash_buckets
+        model._set_types(attribute_types, bin_edges)
+        model.set_cache_size(cache_size)
+        model._restore(classes, vocabularies, class_counts, value_counts, log_priors, log_table, numeric_moments)
+        return model
+
+    def _restore(self, classes, vocabularies, class_counts, value_counts, log_priors=None, log_table=None,
+                 numeric_moments=None):
+        self._reset()
+        self.classes = list(classes)
+        self.class_index = {class_label: c for c, class_label in enumerate(self.classes)}
+        # Vocabulary atribut hashed tidak disimpan per nilai (misalnya di header file model)
+        self.vocabularies = [HashedVocabulary(self.hash_buckets) if attribute_type == HASHED else list(vocabulary)
+                             for attribute_type, vocabulary in zip(self.attribute_types, vocabularies)]
+        self.value_index = [vocabulary_index(vocabulary) for vocabulary in self.vocabularies]
+        self.class_counts = class_counts
+        self.value_counts = list(value_counts)
+        if numeric_moments is not None:
+            self.numeric_counts, self.numeric_means, self.numeric_m2 = numeric_moments
+        if log_priors is not None and log_table is not None:
+            self.log_priors = log_priors
+            self.log_table = log_table
+            self.offsets = self._block_offsets()
+            self._build_gaussian()
+        else:
+            self._tables_stale = True
+
+    def _block_offsets(self):
+        """Baris awal blok setiap atribut di log_table (|V_X| + 1 baris per atribut)."""
+        sizes = [len(vocabulary) + 1 for vocabulary in self.vocabularies]
+        return np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.int64) if sizes else np.zeros(0, dtype=np.int64)
+
+    @property
+    def total_instances(self):
+        return int(self.class_counts.sum())
+
+    @property
+    def prior_probs(self):
+        """P(class) per label kelas, sesuai urutan kemunculan kelas di data training."""
+        self._ensure_tables()
+        return {class_label: math.exp(log_prior) for class_label, log_prior in zip(self.classes, self.log_priors.tolist())}
+
+    @property
+    def numeric_moments(self):
+        """(jumlah, rata-rata, M2) atribut gaussian per kelas, masing-masing berbentuk (C, G)."""
+        return self.numeric_counts, self.numeric_means, self.numeric_m2
+
+    @property
+    def nbytes(self):
+        """Perkiraan memori array hitungan dan tabel model (byte), tanpa vocabulary."""
+        arrays = [self.class_counts, self.log_priors, *self.numeric_moments, self.sparse_indptr,
+                  self.sparse_classes, self.sparse_weights]
+        if self.log_table is not None:
+            arrays.append(self.log_table)
+        return sum(array.nbytes for array in arrays) + sum(counts.nbytes for counts in self.value_counts)
+
+    @property
+    def vocabulary_sizes(self):
+        """|V_X| per atribut."""
+        return {attr: len(vocabulary) for attr, vocabulary in zip(self.attribute_list, self.vocabularies)}
+
+    # --- Cache prediksi ---
+
+    def set_cache_size(self, cache_size):
+        """Mengatur jumlah maksimum kombinasi nilai di cache prediksi (0 = tanpa cache)."""
+        self.cache_size = cache_size
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Mengosongkan cache prediksi beserta hitungan hit dan miss."""
+        self._cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def cache_info(self):
+        return CacheInfo(self.cache_hits, self.cache_misses, self.cache_size, len(self._cache))
+
+    # --- Encoding ---
+
+    def _columns(self, X):
+        """Mengubah baris nilai atribut X menjadi list kolom (urut sesuai attribute_list)."""
+        X = list(X)
+        return [list(column) for column in zip(*X)] if X else [[] for _ in self.attribute_list]
+
+    def encode_columns(self, columns, grow=False):
+        """Meng-encode kolom-kolom atribut (urut sesuai attribute_list) menjadi matriks kode (n, A)."""
+        n = len(columns[0]) if columns else 0
+        codes = np.empty((n, len(self.attribute_list)), dtype=np.int64)
+        for a, column in enumerate(columns):
+            codes[:, a] = encode_column(column, self.attribute_types[a], self.value_index[a],
+                                        self.vocabularies[a] if grow else None, self.bin_edges[a], n_buckets=self.hash_buckets)
+        return codes
+
+    def encode(self, X, grow=False):
+        """Meng-encode baris nilai atribut X menjadi matriks kode (n, A). Nilai yang tidak
+        ada di training diberi kode |V_X| (kolom fallback di tabel likelihood)."""
+        return self.encode_columns(self._columns(X), grow)
+
+    def encode_numbers_columns(self, columns):
+        """Nilai atribut gaussian dari kolom-kolom atribut sebagai array (n, G), atau None jika tidak ada."""
+        if not self.gaussian_index:
+            return None
+        return np.column_stack([parse_numbers(columns[a]) for a in self.gaussian_index])
+
+    def encode_numbers(self, X):
+        """Seperti encode_numbers_columns() untuk baris nilai atribut X."""
+        return self.encode_numbers_columns(self._columns(X))
+
+    def encode_labels(self, y, grow=False):
+        """Meng-encode label kelas menjadi kode integer."""
+        y = list(y)
+        return encode_values(y, self.class_index, self.classes if grow else None)
+
+    # --- Training ---
+
+    def _resolve_types(self, columns):
+        """Mendeteksi tipe atribut (jika numeric_mode atau hash_buckets diberikan) dan menghitung batas
+        interval atribut binned yang belum diketahui dari kolom data training."""
+        if self.numeric_mode or self.hash_buckets:
+            self._set_types(detect_attribute_types(columns, self.numeric_mode, self.hash_buckets))
+        self.bin_edges = [quantile_edges(parse_numbers(column), self.n_bins) if attribute_type == BINNED and edges is None
+                          else edges for column, attribute_type, edges in zip(columns, self.attribute_types, self.bin_edges)]
+
+    def fit(self, X, y):
+        """Melatih model dari baris nilai atribut X (urut sesuai attribute_list) dan label kelas y."""
+        columns = self._columns(X)
+        self._resolve_types(columns)
+        self._reset()
+        codes = self.encode_columns(columns, grow=True)
+        class_codes = self.encode_labels(y, grow=True)
+        return self.fit_encoded(codes, class_codes, self.encode_numbers_columns(columns))
+
+    def fit_encoded(self, codes, class_codes, numbers=None):
+        """Menghitung matriks hitungan kelas x nilai dengan np.bincount dari data yang sudah di-encode.
+
+        Kode harus mengacu pada vocabularies dan classes model ini (lihat encode(grow=True)).
+        numbers berisi nilai atribut gaussian (n, G) dan wajib jika model memiliki atribut gaussian.
+        """
+        self._accumulate(codes, class_codes, numbers)
+        self._build_tables()
+        return self
+
+    def fit_chunks(self, reader):
+        """Melatih model langsung dari chunk DataReader tanpa memuat seluruh file ke memori.
+
+        Dictionary encoding milik reader dipakai sebagai vocabulary model.
+        """
+        if reader.attribute_list != self.attribute_list:
+            raise ValueError(f"Atribut file {reader.attribute_list} tidak sesuai dengan atribut model {self.attribute_list}.")
+        self._set_types(reader.attribute_types, reader.bin_edges)
+        self.hash_buckets = reader.hash_buckets
+        self._reset()
+        self.vocabularies, self.value_index = reader.vocabularies, reader.value_index
+        self.classes, self.class_index = reader.classes, reader.class_index
+        for chunk in reader.iter_chunks():
+            self._accumulate(chunk.codes, chunk.class_codes, chunk.numbers)
+        self._build_tables()
+        return self
+
+    def _empty_counts(self, shape):
+        return SparseCounts(shape) if self.sparse else np.zeros(shape, dtype=np.int64)
+
+    @staticmethod
+    def _grow(counts, shape):
+        """Memperbesar array hitungan (diisi 0) jika kelas atau nilai baru muncul.
+
+        Array read-only (misalnya dari mmap) selalu disalin agar bisa diubah.
+        """
+        if isinstance(counts, SparseCounts):
+            return counts.grow(shape) # Operasi SparseCounts selalu membuat array baru
+        if counts.shape == shape and counts.flags.writeable:
+            return counts
+        grown = np.zeros(shape, dtype=counts.dtype)
+        grown[tuple(slice(0, size) for size in counts.shape)] = counts
+        return grown
+
+    @staticmethod
+    def count_encoded(codes, class_codes, n_classes, vocabulary_sizes):
+        """Menghitung count(C=c) dan matriks count(X=v and C=c) per atribut dengan np.bincount."""
+        codes = np.asarray(codes, dtype=np.int64)
+        class_codes = np.asarray(class_codes, dtype=np.int64)
+        class_counts = np.bincount(class_codes, minlength=n_classes)
+        value_counts = []
+        for a, V in enumerate(vocabulary_sizes):
+            if not V: # Atribut gaussian (atau tanpa nilai) tidak memiliki hitungan nilai
+                value_counts.append(np.zeros((n_classes, 0), dtype=np.int64))
+                continue
+            # Indeks datar class * |V_X| + value sehingga satu bincount menghasilkan matriks (C, |V_X|)
+            flat = np.bincount(class_codes * V + codes[:, a], minlength=n_classes * V)
+            value_counts.append(flat.reshape(n_classes, V))
+        return class_counts, value_counts
+
+    @staticmethod
+    def count_moments(numbers, class_codes, n_classes):
+        """Menghitung jumlah, rata-rata, dan M2 nilai numerik (n, G) per kelas dengan np.bincount.
+        Nilai NaN (bukan angka) tidak dihitung."""
+        numbers = np.asarray(numbers, dtype=np.float64)
+        class_codes = np.asarray(class_codes, dtype=np.int64)
+        G = numbers.shape[1]
+        valid = ~np.isnan(numbers)
+        # Indeks datar class * G + atribut sehingga satu bincount menghasilkan matriks (C, G)
+        flat = (class_codes[:, None] * G + np.arange(G)).ravel()
+
+        def total(weights):
+            return np.bincount(flat, weights=weights.ravel(), minlength=n_classes * G).reshape(n_classes, G)
+
+        counts = total(valid.astype(np.float64))
+        means = np.divide(total(np.where(valid, numbers, 0.0)), counts, out=np.zeros_like(counts), where=counts > 0)
+        deviations = np.where(valid, numbers - means[class_codes], 0.0)
+        return counts.astype(np.int64), means, total(deviations ** 2)
+
+    @staticmethod
+    def combine_moments(counts, means, m2, other_counts, other_means, other_m2):
+        """Menggabungkan momen dua kelompok data (rumus paralel Chan et al.)."""
+        total = counts + other_counts
+        delta = other_means - means
+        ratio = np.divide(other_counts, total, out=np.zeros(total.shape), where=total > 0)
+        return total, means + delta * ratio, m2 + other_m2 + delta ** 2 * counts * ratio
+
+    @staticmethod
+    def subtract_moments(counts, means, m2, part_counts, part_means, part_m2):
+        """Kebalikan combine_moments(): momen data setelah satu kelompok data dikeluarkan."""
+        rest = counts - part_counts
+        rest_means = np.divide(counts * means - part_counts * part_means, rest, out=np.zeros(rest.shape), where=rest > 0)
+        ratio = np.divide(part_counts, counts, out=np.zeros(rest.shape), where=counts > 0)
+        rest_m2 = m2 - part_m2 - (part_means - rest_means) ** 2 * rest * ratio
+        return rest, rest_means, np.where(rest > 1, np.maximum(rest_m2, 0.0), 0.0)
+
+    def _check_numbers(self, numbers, n):
+        if self.gaussian_index and (numbers is None or np.shape(numbers) != (n, len(self.gaussian_index))):
+            raise ValueError(f"Nilai atribut gaussian (numbers) berbentuk ({n}, {len(self.gaussian_index)}) diperlukan.")
+
+    def _accumulate(self, codes, class_codes, numbers=None):
+        """Menambahkan hitungan kelas dan nilai dari satu batch data yang sudah di-encode."""
+        self._check_numbers(numbers, len(class_codes))
+        n_classes = len(self.classes)
+        vocabulary_sizes = [len(vocabulary) for vocabulary in self.vocabularies]
+        if self.sparse:
+            class_codes = np.asarray(class_codes, dtype=np.int64)
+            class_counts = np.bincount(class_codes, minlength=n_classes)
+            # Atribut gaussian (|V_X| = 0) tidak memiliki hitungan nilai, sama seperti count_encoded()
+            value_counts = [SparseCounts.from_codes(codes[:, a], class_codes, (n_classes, V)) if V
+                            else SparseCounts((n_classes, 0)) for a, V in enumerate(vocabulary_sizes)]
+        else:
+            class_counts, value_counts = self.count_encoded(codes, class_codes, n_classes, vocabulary_sizes)
+        self.class_counts = self._grow(self.class_counts, (n_classes,)) + class_counts
+        for a, (V, counts) in enumerate(zip(vocabulary_sizes, value_counts)):
+            self.value_counts[a] = self._grow(self.value_counts[a], (n_classes, V)) + counts
+        if self.gaussian_index:
+            shape = (n_classes, len(self.gaussian_index))
+            moments = [self._grow(moment, shape) for moment in self.numeric_moments]
+            self.numeric_counts, self.numeric_means, self.numeric_m2 = self.combine_moments(
+                *moments, *self.count_moments(numbers, class_codes, n_classes))
+        self._tables_stale = True
+
+    def partial_fit(self, X, y):
+        """Menambahkan data baru ke hitungan model tanpa melatih ulang dari awal.
+
+        Nilai atau kelas yang baru muncul memperbesar vocabulary; penyebut Laplace
+        N_class + |V_X| dihitung ulang saat model dipakai berikutnya. Tipe atribut dan batas
+        interval ditentukan dari batch pertama dan tetap setelahnya.
+        """
+        columns = self._columns(X)
+        if not self.classes:
+            self._resolve_types(columns)
+            self._reset()
+        codes = self.encode_columns(columns, grow=True)
+        class_codes = self.encode_labels(y, grow=True)
+        return self.partial_fit_encoded(codes, class_codes, self.encode_numbers_columns(columns))
+
+    def partial_fit_encoded(self, codes, class_codes, numbers=None):
+        """Seperti partial_fit() untuk data yang sudah di-encode dengan vocabulary model ini,
+        misalnya chunk dari DataReader(..., model=model, grow=True)."""
+        self._accumulate(codes, class_codes, numbers)
+        return self
+
+    def merge(self, other):
+        """Menggabungkan hitungan model lain (misalnya hasil training shard terpisah) ke model ini."""
+        if other.attribute_list != self.attribute_list:
+            raise ValueError(f"Atribut model {other.attribute_list} tidak sesuai dengan atribut model {self.attribute_list}.")
+        if other.attribute_types != self.attribute_types or other.hash_buckets != self.hash_buckets or not all(
+                (edges is None and other_edges is None) or (edges is not None and other_edges is not None
+                                                             and np.array_equal(edges, other_edges))
+                for edges, other_edges in zip(self.bin_edges, other.bin_edges)):
+            raise ValueError("Tipe atribut atau batas interval model tidak sama.")
+        # Petakan kode milik model lain ke kode model ini (vocabulary diperbesar jika perlu)
+        # (bucket atribut hashed dan interval atribut binned sama di kedua model, sehingga kodenya identik)
+        class_map = encode_values(other.classes, self.class_index, self.classes)
+        value_maps = [np.arange(len(vocabulary)) if attribute_type in (BINNED, HASHED)
+                      else encode_values(other_vocabulary, index, vocabulary)
+                      for attribute_type, other_vocabulary, index, vocabulary
+                      in zip(self.attribute_types, other.vocabularies, self.value_index, self.vocabularies)]
+        n_classes = len(self.classes)
+        self.class_counts = self._grow(self.class_counts, (n_classes,))
+        self.class_counts[class_map] += other.class_counts
+        for a, value_map in enumerate(value_maps):
+            shape = (n_classes, len(self.vocabularies[a]))
+            self.value_counts[a] = self._grow(self.value_counts[a], shape)
+            other_counts = other.value_counts[a]
+            if self.sparse:
+                if not isinstance(other_counts, SparseCounts):
+                    other_counts = SparseCounts.from_dense(other_counts)
+                self.value_counts[a] = self.value_counts[a] + other_counts.remap(class_map, value_map, shape)
+                continue
+            if isinstance(other_counts, SparseCounts):
+                other_counts = other_counts.toarray()
+            # Pemetaan kode bersifat satu-satu, sehingga penjumlahan lewat indeks fancy aman
+            self.value_counts[a][np.ix_(class_map, value_map)] += other_counts
+        if self.gaussian_index:
+            shape = (n_classes, len(self.gaussian_index))
+            moments = [self._grow(moment, shape) for moment in self.numeric_moments]
+            other_moments = [np.zeros(shape, dtype=moment.dtype) for moment in moments]
+            for aligned, moment in zip(other_moments, other.numeric_moments):
+                aligned[class_map] = moment
+            self.numeric_counts, self.numeric_means, self.numeric_m2 = self.combine_moments(*moments, *other_moments)
+        self._tables_stale = True
+        return self
+
+    def _build_tables(self):
+        """Menghitung log-prior dan seluruh tabel log-likelihood (termasuk fallback) dari hitungan tersimpan."""
+        N_class = self.class_counts.astype(np.float64)
+        total = N_class.sum()
+        # P(class) = count(class) / total_training_instances
+        with np.errstate(divide='ignore'):
+            self.log_priors = np.log(N_class / total) if total > 0 else np.full_like(N_class, -np.inf)
+
+        # Formula: P(X=v | C=c) = (count(X=v and C=c) + 1) / (count(C=c) + |V_X|)
+        self.offsets = self._block_offsets()
+        if self.sparse:
+            self._build_sparse_tables(N_class)
+            self._build_gaussian()
+            self._tables_stale = False
+            self._cache.clear()
+            return
+
+        # Setiap blok berbentuk (|V_X| + 1, C); baris terakhir adalah fallback dengan count = 0.
+        # Atribut gaussian hanya memiliki satu baris netral (log 1 = 0), likelihood-nya dihitung terpisah
+        blocks = []
+        for attribute_type, counts in zip(self.attribute_types, self.value_counts):
+            if attribute_type == GAUSSIAN:
+                blocks.append(np.zeros((1, len(N_class))))
+                continue
+            V = counts.shape[1]
+            numerators = np.vstack([counts.T + 1, np.ones((1, len(N_class)))])
+            blocks.append(np.log(numerators / (N_class + V)))
+        self.log_table = np.ascontiguousarray(np.vstack(blocks)) if blocks else np.zeros((0, len(self.classes)))
+        self._build_gaussian()
+        self._tables_stale = False
+        self._cache.clear() # Skor lama tidak berlaku lagi untuk tabel baru
+
+    def _build_sparse_tables(self, N_class):
+        """Menghitung tabel mode sparse. Untuk entri bukan nol,
+        log((count + 1) / (N_class + |V_X|)) = log(1 / (N_class + |V_X|)) + log(count + 1),
+        sehingga hanya bagian log(count + 1) yang perlu disimpan per entri."""
+        base = self.log_priors.copy()
+        rows, classes, weights = [], [], []
+        for a, (attribute_type, counts) in enumerate(zip(self.attribute_types, self.value_counts)):
+            if attribute_type == GAUSSIAN:
+                continue
+            base -= np.log(N_class + counts.shape[1])
+            rows.append(counts.values + self.offsets[a])
+            classes.append(counts.classes)
+            weights.append(np.log1p(counts.counts))
+        n_rows = sum(len(vocabulary) + 1 for vocabulary in self.vocabularies)
+        rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        self.sparse_base = base
+        self.sparse_indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=n_rows))]).astype(np.int64)
+        self.sparse_classes = np.concatenate(classes) if classes else np.zeros(0, dtype=np.int64)
+        self.sparse_weights = np.concatenate(weights) if weights else np.zeros(0)
+        self.log_table = None # Tidak ada tabel rapat di mode sparse
+
+    def _build_gaussian(self):
+        """Menghitung varians dan konstanta normalisasi distribusi normal setiap (kelas, atribut gaussian)."""
+        counts = self.numeric_counts.astype(np.float64)
+        variances = np.divide(self.numeric_m2, counts, out=np.zeros(counts.shape), where=counts > 0)
+        # Varians gabungan semua kelas per atribut, untuk epsilon smoothing agar varians 0 tidak membagi nol
+        total = counts.sum(axis=0)
+        overall_means = np.divide((counts * self.numeric_means).sum(axis=0), total, out=np.zeros(total.shape), where=total > 0)
+        overall_m2 = self.numeric_m2.sum(axis=0) + (counts * (self.numeric_means - overall_means) ** 2).sum(axis=0)
+        overall = np.divide(overall_m2, total, out=np.zeros(total.shape), where=total > 0)
+        epsilon = VAR_SMOOTHING * (overall.max() if overall.size and overall.max() > 0 else 1.0)
+        self.gaussian_variances = variances + epsilon
+        self.gaussian_log_norm = -0.5 * np.log(2 * np.pi * self.gaussian_variances)
+        self.gaussian_present = counts > 0 # Kelas tanpa nilai numerik tidak memberi likelihood
+
+    def _ensure_tables(self):
+        """Menghitung ulang tabel jika hitungan berubah lewat partial_fit() atau merge()."""
+        if self._tables_stale:
+            self._build_tables()
+
+    # --- Prediksi per baris ---
+
+    def _value_code(self, a, value):
+        return int(encode_column([value], self.attribute_types[a], self.value_index[a], bin_edges=self.bin_edges[a],
+                                 n_buckets=self.hash_buckets)[0])
+
+    def likelihood(self, class_label, attr, value):
+        """Mengembalikan (P(attr=value | class), apakah nilai pernah terlihat di training).
+
+        Untuk atribut gaussian hasilnya adalah densitas normal, dan nilai yang bukan angka
+        dianggap tidak ada (likelihood 1, tidak terlihat).
+        """
+        self._ensure_tables()
+        a = self.attribute_list.index(attr)
+        c = self.class_index[class_label]
+        if self.attribute_types[a] == GAUSSIAN:
+            g = self.gaussian_index.index(a)
+            x = parse_numbers([value])[0]
+            if np.isnan(x) or not self.gaussian_present[c, g]:
+                return 1.0, not np.isnan(x)
+            log_density = self.gaussian_log_norm[c, g] - 0.5 * (x - self.numeric_means[c, g]) ** 2 / self.gaussian_variances[c, g]
+            return math.exp(log_density), True
+        code = self._value_code(a, value)
+        V = len(self.vocabularies[a])
+        if self.sparse:
+            count = self.value_counts[a][c, code] if code < V else 0
+            return float((count + 1) / (self.class_counts[c] + V)), code < V
+        return math.exp(self.log_table[self.offsets[a] + code, c]), code < V
+
+    def value_count(self, class_label, attr, value):
+        """Mengembalikan count(X=value and C=class) dari data training (interval nilai untuk atribut
+        binned, jumlah nilai numerik kelas untuk atribut gaussian)."""
+        a = self.attribute_list.index(attr)
+        c = self.class_index[class_label]
+        if self.attribute_types[a] == GAUSSIAN:
+            return int(self.numeric_counts[c, self.gaussian_index.index(a)])
+        code = self._value_code(a, value)
+        return int(self.value_counts[a][c, code]) if code < len(self.vocabularies[a]) else 0
+
+    def log_joint_probabilities(self, row):
+        """Menghitung log(P(row | class) * P(class)) untuk setiap kelas."""
+        codes = self.encode([row])
+        return dict(zip(self.classes, self.log_joint_encoded(codes, self.encode_numbers([row]))[0].tolist()))
+
+    @staticmethod
+    def normalize_log(log_probabilities):
+        """Menormalkan log-probabilitas unnormalized dengan log-sum-exp sehingga jumlahnya 1."""
+        if not log_probabilities:
+            return {}
+        top = max(log_probabilities.values())
+        if top == -math.inf:
+            return {class_label: 0.0 for class_label in log_probabilities}
+        shifted = {class_label: math.exp(log_prob - top) for class_label, log_prob in log_probabilities.items()}
+        total = sum(shifted.values())
+        return {class_label: prob / total for class_label, prob in shifted.items()}
+
+    @staticmethod
+    def best_class(probabilities):
+        """Memilih kelas dengan (log-)probabilitas tertinggi."""
+        if probabilities:
+            return max(probabilities, key=probabilities.get)
+        return UNKNOWN_CLASS
+
+    # --- Prediksi batch (vektorisasi) ---
+
+    def log_joint_encoded(self, codes, numbers=None):
+        """Menghitung log(P(row | class) * P(class)) untuk matriks kode (n, A) dalam satu
+        gather-and-sum. Hasil berbentuk (n, C).
+
+        numbers berisi nilai atribut gaussian (n, G) dan wajib jika model memiliki atribut
+        gaussian; skor kategorikal tetap memakai cache, lalu log-densitas normal ditambahkan.
+        """
+        self._ensure_tables()
+        codes = np.asarray(codes, dtype=np.int64)
+        self._check_numbers(numbers, len(codes))
+        if not len(self.attribute_list):
+            return np.broadcast_to(self.log_priors, (len(codes), len(self.classes))).copy()
+        if self.cache_size > 0 and len(codes):
+            scores = self._log_joint_cached(codes)
+        else:
+            scores = self._categorical_scores(codes)
+        if self.gaussian_index:
+            scores += self._log_gaussian(numbers)
+        return scores
+
+    def _categorical_scores(self, codes):
+        """Log-prior ditambah jumlah log-likelihood atribut non-gaussian untuk matriks kode (n, A)."""
+        if not self.sparse:
+            return self.log_priors + self.log_table[codes + self.offsets].sum(axis=1)
+        # Setiap (baris, atribut) memakai entri blok kodenya: indptr[r] hingga indptr[r + 1]
+        n_classes = len(self.classes)
+        rows = (codes + self.offsets).reshape(-1)
+        starts = self.sparse_indptr[rows]
+        lengths = self.sparse_indptr[rows + 1] - starts
+        entries = np.arange(lengths.sum()) + np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        row_ids = np.repeat(np.arange(len(rows)) // codes.shape[1], lengths)
+        corrections = np.bincount(row_ids * n_classes + self.sparse_classes[entries], weights=self.sparse_weights[entries],
+                                  minlength=len(codes) * n_classes)
+        return self.sparse_base + corrections.reshape(len(codes), n_classes)
+
+    def _log_gaussian(self, numbers):
+        """Jumlah log-densitas normal atribut gaussian per kelas, bentuk (n, C). Nilai NaN diabaikan."""
+        x = np.asarray(numbers, dtype=np.float64)[:, None, :] # (n, 1, G)
+        terms = self.gaussian_log_norm - 0.5 * (x - self.numeric_means) ** 2 / self.gaussian_variances
+        return np.where(np.isnan(x) | ~self.gaussian_present, 0.0, terms).sum(axis=2)
+
+    def _log_joint_cached(self, codes):
+        """Seperti log_joint_encoded(), tetapi setiap kombinasi kode unik dicari dulu di cache LRU.
+        Hanya kombinasi yang belum ada di cache yang dihitung dengan gather-and-sum."""
+        unique_codes, inverse = np.unique(codes, axis=0, return_inverse=True)
+        keys = [tuple(row) for row in unique_codes.tolist()]
+        scores = np.empty((len(keys), len(self.classes)))
+        missing = []
+        for i, key in enumerate(keys):
+            cached = self._cache.get(key)
+            if cached is None:
+                missing.append(i)
+            else:
+                self._cache.move_to_end(key)
+                scores[i] = cached
+        if missing:
+            scores[missing] = self._categorical_scores(unique_codes[missing])
+            for i in missing:
+                self._cache[keys[i]] = scores[i].copy()
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False) # Buang kombinasi yang paling lama tidak dipakai
+        # Setiap baris dihitung sebagai miss hanya sekali per kombinasi yang belum ada di cache
+        self.cache_misses += len(missing)
+        self.cache_hits += len(codes) - len(missing)
+        return scores[inverse.reshape(-1)]
+
+    def unseen_count(self, codes):
+        """Jumlah pasangan (baris, atribut) pada matriks kode (n, A) yang memakai likelihood
+        fallback karena nilainya tidak ada di data training."""
+        # Atribut gaussian tidak memiliki vocabulary dan tidak pernah memakai fallback
+        categorical = [a for a, attribute_type in enumerate(self.attribute_types) if attribute_type != GAUSSIAN]
+        vocabulary_sizes = np.array([len(self.vocabularies[a]) for a in categorical], dtype=np.int64)
+        return int((np.asarray(codes)[:, categorical] >= vocabulary_sizes).sum())
+
+    def predict_proba_encoded(self, codes, numbers=None):
+        """Probabilitas ternormalisasi berbentuk (n, C) untuk matriks kode (n, A)."""
+        scores = self.log_joint_encoded(codes, numbers)
+        top = scores.max(axis=1, keepdims=True) if scores.size else np.zeros((len(scores), 1))
+        # Log-sum-exp: geser dengan nilai maksimum per baris sebelum exp agar tidak underflow.
+        # Jika semua kelas bernilai -inf (model kosong), hasil normalisasi adalah 0
+        shifted = np.exp(scores - np.where(np.isfinite(top), top, 0.0))
+        total = shifted.sum(axis=1, keepdims=True)
+        return np.divide(shifted, total, out=np.zeros_like(shifted), where=total > 0)
+
+    def predict_encoded(self, codes, numbers=None):
+        """Kode kelas hasil prediksi untuk matriks kode (n, A)."""
+        return self.log_joint_encoded(codes, numbers).argmax(axis=1)
+
+    def predict_proba(self, X):
+        """Mengembalikan probabilitas ternormalisasi (dict class -> prob) untuk setiap baris X."""
+        columns = self._columns(X)
+        probabilities = self.predict_proba_encoded(self.encode_columns(columns), self.encode_numbers_columns(columns))
+        return [dict(zip(self.classes, row.tolist())) for row in probabilities]
+
+    def predict(self, X):
+        """Memprediksi kelas untuk setiap baris X."""
+        if not self.classes:
+            return [UNKNOWN_CLASS for _ in X]
+        columns = self._columns(X)
+        return [self.classes[c] for c in self.predict_encoded(self.encode_columns(columns), self.encode_numbers_columns(columns))]
@@ -0,0 +1,74 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from DataLoader import DEFAULT_BINS, DEFAULT_CHUNK_SIZE, DataReader
+from NaiveBayesModel import NaiveBayesModel
+
+
+def byte_ranges(file_path, n_shards):
+    """Membagi isi file setelah header menjadi paling banyak n_shards rentang byte (start, end).
+
+    Setiap batas digeser ke awal baris berikutnya sehingga tidak ada baris yang terpotong.
+    """
+    with open(file_path, 'rb') as f:
+        f.readline() # Lewati header
+        data_start = f.tell()
+        file_size = os.fstat(f.fileno()).st_size
+        boundaries = [data_start]
+        for i in range(1, n_shards):
+            position = data_start + (file_size - data_start) * i // n_shards
+            f.seek(max(position - 1, data_start))
+            f.readline() # Maju ke awal baris berikutnya
+            boundary = f.tell()
+            if boundaries[-1] < boundary < file_size:
+                boundaries.append(boundary)
+        boundaries.append(file_size)
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end]
+
+
+def count_shard(file_path, byte_range, chunk_size=DEFAULT_CHUNK_SIZE, attribute_types=None, bin_edges=None,
+                hash_buckets=0, sparse=False):
+    """Menghitung kelas dan nilai atribut pada satu rentang byte (dijalankan di proses worker).
+
+    Mengembalikan (model hitungan shard, daftar pesan peringatan).
+    """
+    warnings = []
+    reader = DataReader(file_path, chunk_size=chunk_size, on_warning=warnings.append, byte_range=byte_range,
+                        attribute_types=attribute_types, bin_edges=bin_edges, hash_buckets=hash_buckets)
+    model = NaiveBayesModel(reader.attribute_list, sparse=sparse)
+    model.fit_chunks(reader)
+    return model, warnings
+
+
+def fit_parallel(file_path, n_workers=None, chunk_size=DEFAULT_CHUNK_SIZE, on_warning=None, numeric_mode=None,
+                 n_bins=DEFAULT_BINS, hash_buckets=0, sparse=False):
+    """Melatih NaiveBayesModel dari file dengan membagi file ke beberapa proses.
+
+    Setiap proses menghitung satu rentang byte, lalu hitungan shard digabung (merge) secara
+    berurutan sehingga urutan kelas dan nilai sama dengan training satu proses. Tipe atribut
+    dan batas interval ditentukan sekali dari awal file agar semua shard memakai yang sama.
+    """
+    n_workers = n_workers or os.cpu_count() or 1
+    reader = DataReader(file_path, chunk_size=chunk_size, numeric_mode=numeric_mode, n_bins=n_bins,
+                        hash_buckets=hash_buckets) # Validasi header
+    attribute_types, bin_edges = reader.attribute_types, reader.bin_edges
+    model = NaiveBayesModel(reader.attribute_list, attribute_types=attribute_types, bin_edges=bin_edges, sparse=sparse,
+                            hash_buckets=hash_buckets)
+    ranges = byte_ranges(file_path, n_workers)
+
+    # Tanpa proses tambahan jika hanya ada satu worker atau satu shard
+    executor = ProcessPoolExecutor(max_workers=n_workers) if n_workers > 1 and len(ranges) > 1 else None
+    mapper = executor.map if executor is not None else map
+    try:
+        for shard_model, warnings in mapper(count_shard, repeat(file_path), ranges, repeat(chunk_size),
+                                            repeat(attribute_types), repeat(bin_edges), repeat(hash_buckets),
+                                            repeat(sparse)):
+            if on_warning is not None:
+                for message in warnings:
+                    on_warning(message)
+            model.merge(shard_model)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return model
@@ -0,0 +1,33 @@
+DEFAULT_FLUSH_LINES = 500 # Jumlah entri yang ditampung sebelum dikirim sebagai satu blok
+DEFAULT_MAX_DISPLAY_ROWS = 100 # Jumlah baris yang ditampilkan rinci sebelum diringkas
+
+
+class ReportBuilder:
+    """Menampung teks laporan dan mengirimnya per blok.
+
+    Setiap pemanggilan append() hanya menambah ke buffer; on_flush dipanggil sekali untuk
+    setiap flush_lines entri (atau saat flush() dipanggil), sehingga tampilan tidak perlu
+    melakukan relayout untuk setiap baris.
+    """
+
+    def __init__(self, on_flush, flush_lines=DEFAULT_FLUSH_LINES):
+        self.on_flush = on_flush # Callback yang menerima satu blok teks
+        self.flush_lines = flush_lines
+        self._lines = []
+
+    def append(self, text):
+        self._lines.append(text)
+        if len(self._lines) >= self.flush_lines:
+            self.flush()
+
+    def flush(self):
+        """Mengirim seluruh isi buffer sebagai satu blok teks."""
+        if self._lines:
+            block = "\n".join(self._lines)
+            self._lines = []
+            self.on_flush(block)
+
+
+def truncated_notice(shown, total, what="baris"):
+    """Kalimat ringkasan untuk bagian laporan yang tidak ditampilkan seluruhnya."""
+    return f"... ({total - shown} {what} lainnya tidak ditampilkan, hanya {shown} dari {total} yang ditampilkan)"
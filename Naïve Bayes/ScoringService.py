@@ -0,0 +1,251 @@
+import asyncio
+import json
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+
+DEFAULT_MAX_BATCH_ROWS = 4096 # Jumlah baris maksimum per micro-batch
+DEFAULT_MAX_DELAY = 0.002 # Waktu tunggu maksimum (detik) untuk mengumpulkan request lain ke satu batch
+LATENCY_WINDOW = 10000 # Jumlah latensi request terakhir yang dipakai untuk p50/p99
+MAX_BODY_BYTES = 64 << 20 # Batas ukuran body request
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large"}
+
+
+class ServiceStats:
+    """Counter request, baris, batch, dan latensi layanan scoring."""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.started = time.perf_counter()
+        self.latencies = deque(maxlen=window) # Latensi (detik) request terakhir
+        self.requests = 0
+        self.rows = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_rows = 0
+
+    def record_request(self, latency, rows):
+        self.latencies.append(latency)
+        self.requests += 1
+        self.rows += rows
+
+    def record_batch(self, rows):
+        self.batches += 1
+        self.batched_rows += rows
+
+    def to_dict(self):
+        uptime = time.perf_counter() - self.started
+        latencies = np.array(self.latencies) * 1000
+        p50, p99 = np.percentile(latencies, [50, 99]).tolist() if len(latencies) else (0.0, 0.0)
+        return {
+            'uptime_detik': uptime,
+            'request': self.requests,
+            'baris': self.rows,
+            'error': self.errors,
+            'batch': self.batches,
+            'rata_rata_baris_per_batch': self.batched_rows / self.batches if self.batches else 0.0,
+            'latensi_ms': {'p50': p50, 'p99': p99, 'jumlah_sampel': len(latencies)},
+            'throughput': {
+                'request_per_detik': self.requests / uptime if uptime > 0 else 0.0,
+                'baris_per_detik': self.rows / uptime if uptime > 0 else 0.0,
+            },
+        }
+
+
+class MicroBatcher:
+    """Menggabungkan request yang datang bersamaan menjadi satu batch kode untuk
+    predict_proba_encoded(), lalu membagikan hasilnya kembali ke setiap request.
+
+    Batch dikirim saat jumlah baris mencapai max_batch_rows atau max_delay detik
+    setelah request pertama di batch tersebut.
+    """
+
+    def __init__(self, model, stats, max_batch_rows=DEFAULT_MAX_BATCH_ROWS, max_delay=DEFAULT_MAX_DELAY):
+        self.model = model
+        self.stats = stats
+        self.max_batch_rows = max_batch_rows
+        self.max_delay = max_delay
+        self.queue = asyncio.Queue() # (kode (n, A), nilai gaussian (n, G) atau None, future)
+
+    async def score(self, codes, numbers=None):
+        """Mengembalikan probabilitas (n, C) untuk kode (n, A) setelah batch-nya diproses."""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((codes, numbers, future))
+        return await future
+
+    async def _collect(self):
+        """Menunggu request pertama, lalu mengumpulkan request berikutnya hingga batas batch."""
+        loop = asyncio.get_running_loop()
+        items = [await self.queue.get()]
+        rows = len(items[0][0])
+        deadline = loop.time() + self.max_delay
+        while rows < self.max_batch_rows:
+            if self.queue.empty():
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                item = self.queue.get_nowait()
+            items.append(item)
+            rows += len(item[0])
+        return items, rows
+
+    async def run(self):
+        while True:
+            items, rows = await self._collect()
+            try:
+                numbers = None
+                if self.model.gaussian_index:
+                    numbers = np.concatenate([numbers for _, numbers, _ in items])
+                probabilities = self.model.predict_proba_encoded(np.concatenate([codes for codes, _, _ in items]), numbers)
+            except Exception as error:
+                for _, _, future in items:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            self.stats.record_batch(rows)
+            sizes = [len(codes) for codes, _, _ in items]
+            for (_, _, future), part in zip(items, np.split(probabilities, np.cumsum(sizes)[:-1])):
+                if not future.done(): # Klien mungkin sudah memutus koneksi
+                    future.set_result(part)
+
+
+class ScoringService:
+    """Layanan scoring HTTP/1.1 lokal (TCP atau Unix socket) berbasis asyncio tanpa dependensi luar.
+
+    POST /predict menerima satu baris (objek JSON atribut -> nilai) atau list baris dengan
+    skema atribut yang sama seperti file data; kolom lain (ID, hipotesis) diabaikan.
+    GET /stats mengembalikan counter throughput dan latensi p50/p99.
+    """
+
+    def __init__(self, model, max_batch_rows=DEFAULT_MAX_BATCH_ROWS, max_delay=DEFAULT_MAX_DELAY):
+        self.model = model
+        self.stats = ServiceStats()
+        self.batcher = MicroBatcher(model, self.stats, max_batch_rows, max_delay)
+
+    def encode_rows(self, rows):
+        """Meng-encode list dict baris menjadi matriks kode (n, A) dan nilai atribut gaussian
+        (n, G) atau None, sesuai attribute_list model."""
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError("Body harus berupa objek baris atau list objek baris.")
+        missing = [attr for attr in self.model.attribute_list if rows and attr not in rows[0]]
+        if missing:
+            raise ValueError(f"Atribut {missing} tidak ada pada baris data.")
+        try:
+            columns = [[str(row[attr]).strip() for row in rows] for attr in self.model.attribute_list]
+        except KeyError as error:
+            raise ValueError(f"Atribut {error} tidak ada pada salah satu baris data.")
+        return self.model.encode_columns(columns), self.model.encode_numbers_columns(columns)
+
+    async def predict(self, payload):
+        single = isinstance(payload, dict)
+        rows = [payload] if single else payload
+        codes, numbers = self.encode_rows(rows)
+        probabilities = await self.batcher.score(codes, numbers) if len(codes) else np.zeros((0, len(self.model.classes)))
+        results = [{
+            'prediksi': self.model.classes[c],
+            'probabilitas': dict(zip(self.model.classes, row)),
+        } for c, row in zip(probabilities.argmax(axis=1).tolist(), probabilities.tolist())]
+        return results[0] if single else results
+
+    async def dispatch(self, method, path, body):
+        """Mengembalikan (status HTTP, payload JSON) untuk satu request."""
+        if path == '/stats':
+            if method != 'GET':
+                return 405, {'error': "Gunakan GET untuk /stats."}
+            stats = self.stats.to_dict()
+            stats['cache'] = self.model.cache_info()._asdict()
+            return 200, stats
+        if path != '/predict':
+            return 404, {'error': f"Path {path} tidak dikenal."}
+        if method != 'POST':
+            return 405, {'error': "Gunakan POST untuk /predict."}
+        start = time.perf_counter()
+        try:
+            payload = json.loads(body.decode('utf-8'))
+            result = await self.predict(payload)
+        except (ValueError, UnicodeDecodeError) as error: # json.JSONDecodeError adalah turunan ValueError
+            self.stats.errors += 1
+            return 400, {'error': str(error)}
+        self.stats.record_request(time.perf_counter() - start, 1 if isinstance(payload, dict) else len(payload))
+        return 200, result
+
+    async def handle_connection(self, reader, writer):
+        """Melayani request HTTP/1.1 pada satu koneksi (keep-alive) hingga klien menutupnya."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                parts = request_line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get('content-length', 0) or 0)
+                if len(parts) != 3:
+                    status, payload = 400, {'error': "Request line tidak valid."}
+                elif length > MAX_BODY_BYTES:
+                    status, payload = 413, {'error': f"Body lebih dari {MAX_BODY_BYTES} byte."}
+                else:
+                    body = await reader.readexactly(length)
+                    status, payload = await self.dispatch(parts[0].upper(), parts[1], body)
+                close = status == 413 or headers.get('connection', '').lower() == 'close'
+                data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                writer.write((f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                              f"Content-Type: application/json; charset=utf-8\r\n"
+                              f"Content-Length: {len(data)}\r\n"
+                              f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n").encode('latin-1') + data)
+                await writer.drain()
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass # Koneksi terputus atau header tidak valid
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass # Klien sudah memutus koneksi
+
+    async def serve(self, host='127.0.0.1', port=8000, unix_path=None, on_ready=None):
+        """Menjalankan layanan hingga dibatalkan. Dengan unix_path, layanan mendengarkan di Unix socket."""
+        batch_task = asyncio.create_task(self.batcher.run())
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_connection, path=unix_path)
+            address = unix_path
+        else:
+            server = await asyncio.start_server(self.handle_connection, host, port)
+            address = "http://{}:{}".format(*server.sockets[0].getsockname()[:2])
+        if on_ready is not None:
+            on_ready(address)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batch_task.cancel()
+
+
+def run_service(model, host='127.0.0.1', port=8000, unix_path=None, max_batch_rows=DEFAULT_MAX_BATCH_ROWS,
+                max_delay=DEFAULT_MAX_DELAY):
+    """Menjalankan ScoringService di event loop baru hingga dihentikan dengan Ctrl+C."""
+    service = ScoringService(model, max_batch_rows, max_delay)
+
+    def ready(address):
+        print(f"Layanan scoring berjalan di {address} (POST /predict, GET /stats)", file=sys.stderr)
+
+    try:
+        asyncio.run(service.serve(host, port, unix_path, on_ready=ready))
+    except KeyboardInterrupt:
+        pass
+    return service.stats